@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Pages/second for the cached page shell.
+Renders the real voices page and a synthetic 10k-page run, once with the shell
+compiled and cached (what generators do) and once re-parsing it per page (the
+cost of re-assembling the shell for every page). Run from the repo root:
+    python benchmarks/bench_page_shell.py"""
+
+import os, sys, time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+import generate_top_voices
+from page_shell import BASE_URL, compile_shell, iter_page, render_page
+
+def uncached_render(active=None, **values):
+    return compile_shell.__wrapped__(active).render(**values)
+
+def uncached_iter(active=None, **values):
+    return compile_shell.__wrapped__(active).iter_render(**values)
+
+def synthetic_pages(n):
+    for i in range(n):
+        yield {
+            "active": "/jobs/",
+            "title": f"Synthetic Job {i} — PE Collective",
+            "description": f"Synthetic job posting number {i} for benchmarking.",
+            "url": f"{BASE_URL}/jobs/synthetic-{i}/",
+            "og_title": f"Synthetic Job {i}",
+            "og_description": "Benchmark page.",
+            "main": f'<main id="main"><h1>Synthetic Job {i}</h1>' + '<p>Lorem ipsum dolor sit amet.</p>' * 40 + '</main>',
+        }
+
+def pages_per_second(render, pages):
+    start = time.perf_counter()
+    for page in pages:
+        render(**page)
+    return len(pages) / (time.perf_counter() - start)
+
+def bench_voices(iter_render, repeat=2000):
+    data = generate_top_voices.load_voices()
+    generate_top_voices.iter_page = iter_render
+    try:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            generate_top_voices.render(data)
+        return repeat / (time.perf_counter() - start)
+    finally:
+        generate_top_voices.iter_page = iter_page
+
+if __name__ == '__main__':
+    pages = list(synthetic_pages(10_000))
+    print(f"voices page, cached shell:      {bench_voices(iter_page):>10,.0f} pages/s")
+    print(f"voices page, re-parsed shell:   {bench_voices(uncached_iter):>10,.0f} pages/s")
+    print(f"10k synthetic, cached shell:    {pages_per_second(render_page, pages):>10,.0f} pages/s")
+    print(f"10k synthetic, re-parsed shell: {pages_per_second(uncached_render, pages):>10,.0f} pages/s")
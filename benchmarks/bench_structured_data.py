@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""structured_data.item_list() vs the ','.join of f-strings it replaced in
+generate_top_voices. Checks both give the same JSON on clean data and that only
+the builder survives a quote in a name, then times the ItemList of a synthetic
+list (default 100k voices), best of several runs: joined in memory, and streamed
+through site_output.write_page the way generate() consumes it. The builder is
+slower: about half the speed of the join, 50-100 ms more per 100k items. That
+is what escaping every value costs; the f-strings only win by not escaping.
+Run from anywhere:
+    python benchmarks/bench_structured_data.py [count]"""
+
+import json, os, shutil, sys, tempfile, time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+import site_output, structured_data, voices_data
+from generate_top_voices import _LIST_ROW
+from synthetic import voices_list
+
+def string_items(voices):
+    """The ItemList from before structured_data: one ','.join of f-strings, no escaping."""
+    list_items = ','.join(f'{{"@type":"ListItem","position":{v.rank},"item":{{"@type":"Person","name":"{v.name}","jobTitle":"{v.title}","url":"{v.linkedin_url}"}}}}' for v in voices)
+    yield f'{{"@context":"https://schema.org","@type":"ItemList","name":"Top Voices","numberOfItems":{len(voices)},"itemListElement":[{list_items}]}}'
+
+def builder_items(voices):
+    return structured_data.item_list("Top Voices", len(voices), map(_LIST_ROW, voices),
+                                     "Person", "name", "jobTitle", "url")
+
+def valid(chunks):
+    try:
+        json.loads(''.join(chunks))
+        return True
+    except ValueError:
+        return False
+
+def best(fn, repeat=7):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    voices = voices_data.parse_list(voices_list(count), 'synthetic')["voices"]
+    if json.loads(''.join(string_items(voices))) != json.loads(''.join(builder_items(voices))):
+        sys.exit('item_list() output differs from the string version')
+    quoted = voices_data.parse_list(voices_list(3), 'synthetic')["voices"]
+    quoted[1].name = 'Dwayne "The Prompt" Johnson</script>'
+    print(f'quote in a name: strings {"valid" if valid(string_items(quoted)) else "BROKEN"}, '
+          f'builder {"valid" if valid(builder_items(quoted)) else "BROKEN"}')
+
+    tmp = tempfile.mkdtemp(prefix='pec-bench-')
+    try:
+        print(f'{count:,} list items')
+        for label, consume in (('joined', lambda chunks: ''.join(chunks)),
+                               ('write_page', lambda chunks: site_output.write_page(os.path.join(tmp, 'ld.json'), chunks))):
+            strings = best(lambda: consume(string_items(voices)))
+            builder = best(lambda: consume(builder_items(voices)))
+            print(f'  {label:<11} strings {strings * 1000:>8.1f} ms   builder {builder * 1000:>8.1f} ms  '
+                  f'{strings / builder:.2f}x')
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""The columnar voice_cards() batch renderer vs the per-card f-string it replaced
+(fstring_card(), the voice_card() of before the batch renderer, with today's icon
+markup). Checks both and voice_card() are byte-identical, then times every card of a
+synthetic list (default 100k voices), best of several runs. The batches are
+roughly on par with the f-string (0.9-1.4x from run to run here), well short of
+the 3x the change was after; the 3x+ they beat voice_card() by is against its
+slower CARD_TEMPLATE.format(), not against what they replaced. Run from anywhere:
+    python benchmarks/bench_voice_cards.py [count]"""
+
+import os, sys, time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+import voices_data
+from generate_top_voices import LINKEDIN_ICON, voice_card, voice_cards
+from synthetic import voices_list
+
+def fstring_card(v):
+    tags = ''.join(f'<span class="voice-tag">{t}</span>' for t in v.tags)
+    rc = "voice-rank-top" if v.rank <= 3 else "voice-rank"
+    return f'''<div class="voice-card" id="voice-{v.rank}">
+  <div class="voice-card-header">
+    <div class="{rc}">#{v.rank}</div>
+    <div class="voice-card-info">
+      <h3 class="voice-name"><a href="/voices/{v.slug}/">{v.name}</a></h3>
+      <p class="voice-title">{v.title} at {v.company}</p>
+      <div class="voice-tags">{tags}</div>
+    </div>
+    <a href="{v.linkedin_url}" target="_blank" rel="noopener" class="voice-linkedin-btn" aria-label="View {v.name} on LinkedIn">
+      {LINKEDIN_ICON}
+    </a>
+  </div>
+  <p class="voice-bio">{v.bio}</p>
+</div>'''
+
+def best(fn, repeat=7):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    voices = voices_data.parse_list(voices_list(count), 'synthetic')["voices"]
+    cards = ''.join(voice_cards(voices))
+    if cards != ''.join(map(fstring_card, voices)) or cards != ''.join(map(voice_card, voices)):
+        sys.exit('voice_cards() output differs from the per-card renderers')
+    fstring = best(lambda: list(map(fstring_card, voices)))
+    per_card = best(lambda: list(map(voice_card, voices)))
+    print(f'{count:,} voices')
+    print(f'  f-string per voice:     {fstring * 1000:>8.1f} ms  {count / fstring:>10,.0f} cards/s')
+    print(f'  voice_card per voice:   {per_card * 1000:>8.1f} ms  {count / per_card:>10,.0f} cards/s  {fstring / per_card:.2f}x')
+    for batch in (64, 256, 1024):
+        batched = best(lambda: list(voice_cards(voices, batch)))
+        print(f'  voice_cards batch={batch:<5} {batched * 1000:>8.1f} ms  {count / batched:>10,.0f} cards/s  {fstring / batched:.2f}x')
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Load time and memory for a synthetic 100k-voice list: plain json.load dicts vs
+validated Voice records vs the warm pickle cache. Run from the repo root:
+    python benchmarks/bench_voices_load.py [count]"""
+
+import json, os, shutil, sys, tempfile, time, tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+import voices_data
+from synthetic import write_voices
+
+def measure(label, load, repeat=3):
+    seconds = min(_timed(load) for _ in range(repeat))
+    tracemalloc.start()
+    result = load()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'{label:<28}{seconds * 1000:>10.0f} ms{current / 2**20:>10.1f} MiB held{peak / 2**20:>10.1f} MiB peak')
+    return result
+
+def _timed(load):
+    start = time.perf_counter()
+    load()
+    return time.perf_counter() - start
+
+def load_dicts(path):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'voices.json')
+        write_voices(path, count)
+        voices_data.CACHE_DIR = os.path.join(tmp, 'cache')
+        print(f'{count:,} voices, {os.path.getsize(path) / 2**20:.1f} MiB JSON')
+        measure('json.load (dicts)', lambda: load_dicts(path))
+        measure('validated Voice records', lambda: voices_data.load_list(path, use_cache=False))
+        measure('cold cache (parse + write)', lambda: (shutil.rmtree(voices_data.CACHE_DIR, ignore_errors=True),
+                                                         voices_data.load_list(path)))
+        measure('warm cache (pickle)', lambda: voices_data.load_list(path))
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""Benchmark suite for the site generators, on synthetic data, fully offline.
+Each case runs pyperf-style: a warmup call, then at least MIN_RUNS timed calls
+(more while --budget seconds last), reporting throughput (items/s), latency
+percentiles per call and peak traced memory. Results are written to
+benchmarks/results.json; --save-baseline stores them as benchmarks/baseline.json,
+and later runs fail (exit 1) when a case's fastest call is slower than the
+baseline's by more than --threshold or by twice the noise either run measured,
+whichever is larger, and a second measurement of the case agrees. Cases whose
+median call is under GATE_MIN_MS are shown but never fail the run. Timings only compare on one machine, so the baseline is not
+in git: save one from the main branch, then run your branch against it:
+    git stash; python benchmarks/run.py --save-baseline; git stash pop
+    python benchmarks/run.py [--full] [--only voice_card,load_voices]"""
+
+import contextlib, io, json, os, platform, shutil, statistics, sys, tempfile, time, tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'scripts'))
+
+import generate_top_voices, site_output, structured_data, voices_data
+from page_shell import BASE_URL, iter_page
+from synthetic import glossary_terms, jobs, voices_list, write_voices
+
+RESULTS_PATH = os.path.join(HERE, 'results.json')
+BASELINE_PATH = os.path.join(HERE, 'baseline.json')
+MIN_RUNS = 20  # for a stable fastest and median call; percentiles need more
+MAX_RUNS = 1000
+GATE_MIN_MS = 5  # shorter calls are dominated by timer and GC noise
+
+@contextlib.contextmanager
+def workdir():
+    """Run inside a scratch copy of the repo layout (data/, site/, .build-cache/)."""
+    cwd = os.getcwd()
+    tmp = tempfile.mkdtemp(prefix='pec-bench-')
+    try:
+        os.chdir(tmp)
+        yield tmp
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(tmp, ignore_errors=True)
+
+def case_load_voices(size):
+    write_voices('voices.json', size)
+    return lambda: voices_data.load_list('voices.json', use_cache=False)
+
+def case_load_voices_cached(size):
+    write_voices('voices.json', size)
+    voices_data.load_list('voices.json')
+    return lambda: voices_data.load_list('voices.json')
+
+def case_voice_card(size):
+    voices = voices_data.parse_list(voices_list(size), 'synthetic')["voices"]
+    card = generate_top_voices.voice_card
+    return lambda: [card(v) for v in voices]
+
+def case_voice_cards(size):
+    voices = voices_data.parse_list(voices_list(size), 'synthetic')["voices"]
+    return lambda: list(generate_top_voices.voice_cards(voices))
+
+def case_item_list(size):
+    voices = voices_data.parse_list(voices_list(size), 'synthetic')["voices"]
+    rows = list(map(generate_top_voices._LIST_ROW, voices))
+    return lambda: ''.join(structured_data.item_list("Top Voices", size, rows, "Person", "name", "jobTitle", "url"))
+
+def case_render_list(size):
+    data = voices_data.parse_list(voices_list(size), 'synthetic')
+    def run():
+        with open(os.devnull, 'w', buffering=1 << 16) as f:
+            f.writelines(generate_top_voices.iter_render(data))
+    return run
+
+def case_generate(size):
+    write_voices(generate_top_voices.VOICES_JSON, size)
+    return lambda: generate_top_voices.generate(force=True, jobs=1)
+
+def case_generate_noop(size):
+    write_voices(generate_top_voices.VOICES_JSON, size)
+    generate_top_voices.generate(jobs=1)
+    return lambda: generate_top_voices.generate(jobs=1)
+
+def _job_main(job):
+    return f'''<main id="main">
+    <section class="job-hero"><div class="container">
+      <h1>{job["title"]} at {job["company"]}</h1>
+      <p>{job["location"]} &middot; ${job["salary_min"]:,}–${job["salary_max"]:,} &middot; Posted {job["posted"]}</p>
+    </div></section>
+    <div class="job-description"><p>{job["description"]}</p></div>
+  </main>'''
+
+def case_job_pages(size):
+    all_jobs = list(jobs(size))
+    def run():
+        for job in all_jobs:
+            site_output.write_page(f'site/jobs/{job["id"]}/index.html', iter_page(
+                active="/jobs/", title=f'{job["title"]} at {job["company"]} — PE Collective',
+                description=job["description"][:150], url=f'{BASE_URL}/jobs/{job["id"]}/',
+                og_title=job["title"], og_description=job["company"], main=_job_main(job)))
+    return run
+
+def case_glossary_index(size):
+    terms = list(glossary_terms(size))
+    def main():
+        yield '<main id="main"><div class="glossary-grid">'
+        for t in terms:
+            yield f'<a class="glossary-card" href="/glossary/{t["slug"]}/"><h3>{t["term"]}</h3><p>{t["definition"][:140]}</p></a>'
+        yield '</div></main>'
+    def run():
+        site_output.write_page('site/glossary/index.html', iter_page(
+            active="/tools/", title="AI Glossary — PE Collective", description="Glossary",
+            url=f'{BASE_URL}/glossary/', og_title="AI Glossary", og_description="Glossary", main=main()))
+    return run
+
+# name -> (setup, default sizes, --full sizes). Sizes are items per call.
+CASES = {
+    "load_voices": (case_load_voices, [25, 1_000, 100_000], []),
+    "load_voices_cached": (case_load_voices_cached, [25, 1_000, 100_000], []),
+    "voice_card": (case_voice_card, [25, 1_000, 100_000], []),
+    "voice_cards": (case_voice_cards, [25, 1_000, 100_000], []),
+    "item_list": (case_item_list, [25, 1_000, 100_000], []),
+    "render_list": (case_render_list, [25, 1_000, 100_000], []),
+    "generate": (case_generate, [25, 1_000], [100_000]),
+    "generate_noop": (case_generate_noop, [25, 1_000], [100_000]),
+    "job_pages": (case_job_pages, [25, 1_000], [100_000]),
+    "glossary_index": (case_glossary_index, [25, 1_000, 100_000], []),
+}
+
+def run_case(setup, size, budget):
+    with workdir(), contextlib.redirect_stdout(io.StringIO()):
+        fn = setup(size)
+        fn()  # warmup
+        times, deadline = [], time.perf_counter() + budget
+        while len(times) < MIN_RUNS or (len(times) < MAX_RUNS and time.perf_counter() < deadline):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        tracemalloc.start()
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    times.sort()
+    # A percentile with fewer than two calls above it is just the slowest call; it is left out.
+    pct = lambda p: round(times[int(p * len(times))] * 1000, 3) if len(times) - int(p * len(times)) > 2 else None
+    median = statistics.median(times)
+    return {"size": size, "runs": len(times), "throughput": round(size / median, 1),
+            "min_ms": round(times[0] * 1000, 3), "median_ms": round(median * 1000, 3),
+            "p50_ms": pct(0.50), "p95_ms": pct(0.95), "p99_ms": pct(0.99),
+            "stdev_ms": round(statistics.pstdev(times) * 1000, 3), "peak_kb": peak // 1024}
+
+def noise(r):
+    """Relative spread of a case's calls: how far the median sits above the fastest."""
+    return r["median_ms"] / r["min_ms"] - 1
+
+def compare(results, baseline, threshold, keys=None):
+    """Compare fastest calls, which load on the machine can only slow down. A case
+    regresses when it is slower by more than `threshold` and by more than twice
+    the noise of either run."""
+    regressions = []
+    for key in sorted(keys or results):
+        new, old = results[key], baseline.get(key)
+        if not old or "min_ms" not in old:
+            continue
+        slower = new["min_ms"] / old["min_ms"] - 1
+        allowed = max(threshold, 2 * noise(old), 2 * noise(new))
+        flag = ''
+        if min(old["median_ms"], new["median_ms"]) < GATE_MIN_MS:
+            flag = '  (too short to gate)'
+        elif slower > allowed:
+            flag = '  REGRESSION?' if keys is None else '  REGRESSION'
+            regressions.append(key)
+        print(f'{key:<32}{old["min_ms"]:>12.2f}{new["min_ms"]:>12.2f}{slower:>+9.0%}{allowed:>+10.0%}{flag}')
+    return regressions
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description="Benchmark the site generators on synthetic data.")
+    parser.add_argument('--only', help="comma-separated case names")
+    parser.add_argument('--full', action='store_true', help="also run the 100k-page disk-heavy sizes")
+    parser.add_argument('--budget', type=float, default=1.0, help="seconds of timed calls per case, past MIN_RUNS (default 1)")
+    parser.add_argument('--threshold', type=float, default=0.2, help="smallest slowdown of the fastest call that fails (default 0.2)")
+    parser.add_argument('--save-baseline', action='store_true', help=f"store results as {os.path.relpath(BASELINE_PATH)}")
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    args = parser.parse_args()
+
+    names = args.only.split(',') if args.only else list(CASES)
+    results, runs = {}, {}
+    print(f'{"case":<32}{"items/s":>14}{"median ms":>12}{"p95 ms":>10}{"runs":>6}{"peak KiB":>10}')
+    for name in names:
+        setup, sizes, full_sizes = CASES[name]
+        for size in sizes + (full_sizes if args.full else []):
+            r = run_case(setup, size, args.budget)
+            results[f'{name}[{size}]'] = r
+            runs[f'{name}[{size}]'] = (setup, size)
+            p95 = f'{r["p95_ms"]:.2f}' if r["p95_ms"] is not None else '-'
+            print(f'{name + f"[{size}]":<32}{r["throughput"]:>14,.0f}{r["median_ms"]:>12.2f}{p95:>10}{r["runs"]:>6}{r["peak_kb"]:>10,}')
+
+    meta = {"python": platform.python_version(), "machine": platform.machine(), "system": platform.system()}
+    with open(RESULTS_PATH, 'w') as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2, sort_keys=True)
+    if args.save_baseline:
+        shutil.copyfile(RESULTS_PATH, args.baseline)
+        print(f'Baseline saved to {args.baseline}')
+    elif not os.path.exists(args.baseline):
+        print(f'No baseline at {args.baseline}; nothing to compare (save one with --save-baseline)')
+    else:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("meta") != meta:
+            print(f'\nBaseline is from another machine ({baseline.get("meta")}); the comparison is only indicative')
+        print(f'\n{"vs baseline":<32}{"old min ms":>12}{"new min ms":>12}{"slower":>9}{"fails at":>10}')
+        suspects = compare(results, baseline["results"], args.threshold)
+        regressions = []
+        if suspects:
+            # One slow stretch on a busy machine can push a whole case; measure it again.
+            print(f'\nMeasuring {len(suspects)} case(s) again')
+            for key in suspects:
+                again = run_case(*runs[key], args.budget)
+                results[key] = min(results[key], again, key=lambda r: r["min_ms"])
+            regressions = compare(results, baseline["results"], args.threshold, suspects)
+        if regressions:
+            print(f'{len(regressions)} case(s) regressed beyond their threshold')
+            sys.exit(1)
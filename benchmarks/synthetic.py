@@ -0,0 +1,42 @@
+"""Synthetic datasets for the benchmarks, shaped like the real inputs.
+Voices are cycled from data/top_voices.json with unique names/ranks; jobs and
+glossary terms follow the fields the job board and glossary pages display."""
+
+import json, os, random
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+COMPANIES = ["Anthropic", "OpenAI", "Google DeepMind", "Cohere", "Databricks", "Stripe", "Notion", "Scale AI"]
+ROLES = ["Prompt Engineer", "LLM Engineer", "AI Agent Developer", "MLOps Engineer", "Research Engineer"]
+LOCATIONS = ["Remote", "San Francisco, CA", "New York, NY", "Seattle, WA", "London, UK"]
+
+def voices_list(count):
+    with open(os.path.join(REPO_ROOT, 'data', 'top_voices.json'), 'r') as f:
+        data = json.load(f)
+    base = data["voices"]
+    data["voices"] = [dict(base[i % len(base)], rank=i + 1, name=f'{base[i % len(base)]["name"]} {i}',
+                           tier="leader" if i < count // 2 else "rising")
+                      for i in range(count)]
+    return data
+
+def write_voices(path, count):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(voices_list(count), f)
+
+def jobs(count, seed=0):
+    rng = random.Random(seed)
+    for i in range(count):
+        company, role = rng.choice(COMPANIES), rng.choice(ROLES)
+        low = rng.randrange(120, 260) * 1000
+        yield {"id": f'{company.lower().replace(" ", "-")}-{role.lower().replace(" ", "-")}-{i:06x}',
+               "company": company, "title": role, "location": rng.choice(LOCATIONS),
+               "salary_min": low, "salary_max": low + rng.randrange(20, 120) * 1000,
+               "posted": f'2026-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}',
+               "description": ' '.join(rng.choice(ROLES).lower() for _ in range(120))}
+
+def glossary_terms(count, seed=0):
+    rng = random.Random(seed)
+    for i in range(count):
+        term = f'{rng.choice(["Prompt", "Token", "Vector", "Agent", "Model"])} {rng.choice(["Caching", "Drift", "Routing", "Tuning", "Window"])} {i}'
+        yield {"term": term, "slug": term.lower().replace(' ', '-'),
+               "definition": ' '.join(rng.choice(["context", "model", "latency", "embedding", "retrieval"]) for _ in range(60))}
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""The build cache: one portable directory (.build-cache/) holding everything that
+makes the next build incremental. That is the build manifests, the parsed voices
+lists, the CSS pruning cache and bundle list, and the precompressed .gz/.br
+outputs. Paths inside are relative to the repo, so the directory works on any
+machine; CI restores it between runs (actions/cache in build-site.yml) and
+`pack`/`unpack` move it around as a single file.
+VERSION records the cache format and the Python version (pickled data
+follows it); check() wipes the directory when either differs. seal() writes
+INDEX, the size and sha256 of every file, at the end of a build; check() drops
+any file that no longer matches it (a damaged or partial restore) unless it was
+written after the seal. Every reader treats a missing file as a cold cache, so
+the whole directory is safe to delete at any time."""
+
+import json, os, sys, time  # shutil and tarfile are imported where used
+
+from build_manifest import file_hash, load_json
+
+CACHE_DIR = '.build-cache'
+FORMAT = 2
+VERSION_FILE = 'VERSION'
+INDEX_FILE = 'INDEX'
+TRANSIENT = ('.tmp',)  # files of a write in progress; never indexed
+
+def version_stamp():
+    return {"format": FORMAT, "python": f'{sys.version_info[0]}.{sys.version_info[1]}'}
+
+def _path(name):
+    return os.path.join(CACHE_DIR, name)
+
+def _files(transient=False):
+    """Relative paths of the cache's data files (or, with `transient`, of its
+    temp files), in a stable order."""
+    paths = []
+    for directory, dirs, files in os.walk(CACHE_DIR):
+        dirs.sort()
+        for name in sorted(files):
+            rel = os.path.relpath(os.path.join(directory, name), CACHE_DIR).replace(os.sep, '/')
+            if rel not in (VERSION_FILE, INDEX_FILE) and name.endswith(TRANSIENT) == transient:
+                paths.append(rel)
+    return paths
+
+def _write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp, path)
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def clear():
+    import shutil
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+    _write_json(_path(VERSION_FILE), version_stamp())
+
+def check():
+    """Make the cache safe to read before a build. Returns a one-line status."""
+    if not os.path.isdir(CACHE_DIR):
+        clear()
+        return "empty"
+    found, expected = load_json(_path(VERSION_FILE)), version_stamp()
+    if found != expected:
+        clear()
+        if not isinstance(found, dict):
+            return "reset (no VERSION)"
+        return (f'reset (format {found.get("format")} for Python {found.get("python")}; '
+                f'this build uses format {expected["format"]} for Python {expected["python"]})')
+    index = load_json(_path(INDEX_FILE))
+    if index is None:
+        return f"{len(_files())} files (not sealed)"
+    dropped = 0
+    for name, (size, digest) in index["files"].items():
+        path = _path(name)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            continue
+        if st.st_mtime_ns > index["sealed_ns"] or (st.st_size == size and file_hash(path) == digest):
+            continue
+        _remove(path)
+        dropped += 1
+    for name in _files(transient=True):  # left by a build that was killed mid-write
+        _remove(_path(name))
+    _remove(_path(INDEX_FILE))
+    return f"{len(index['files'])} files verified" + (f", {dropped} damaged and dropped" if dropped else "")
+
+def seal():
+    """Index every file after a build. Returns the number of files indexed."""
+    if not os.path.isdir(CACHE_DIR):
+        return 0
+    sealed_ns = time.time_ns()
+    files = {name: [os.path.getsize(_path(name)), file_hash(_path(name))] for name in _files()}
+    _write_json(_path(INDEX_FILE), {"sealed_ns": sealed_ns, "files": files})
+    return len(files)
+
+def load(name):
+    """Bytes of cache file `name`, or None."""
+    try:
+        with open(_path(name), 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def store(name, data):
+    path = _path(name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+def pack(archive):
+    import tarfile
+    seal()
+    with tarfile.open(archive, 'w:gz') as tar:
+        for name in [VERSION_FILE, INDEX_FILE] + _files():
+            tar.add(_path(name), arcname=name)
+
+def unpack(archive):
+    import shutil, tarfile
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+    with tarfile.open(archive, 'r:gz') as tar:
+        tar.extractall(CACHE_DIR, filter='data')
+    return check()
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description="Check, seal, clear or move the build cache.")
+    parser.add_argument('command', choices=['check', 'seal', 'clear', 'pack', 'unpack'])
+    parser.add_argument('archive', nargs='?', help="the .tar.gz for pack and unpack")
+    args = parser.parse_args()
+    if args.command in ('pack', 'unpack') and not args.archive:
+        parser.error(f'{args.command} needs an archive path')
+    if args.command == 'check':
+        print(f"Build cache: {check()}")
+    elif args.command == 'seal':
+        print(f"Build cache: {seal()} files sealed")
+    elif args.command == 'clear':
+        clear()
+        print("Build cache: cleared")
+    elif args.command == 'pack':
+        pack(args.archive)
+        print(f"Build cache: packed into {args.archive}")
+    else:
+        print(f"Build cache: {unpack(args.archive)}")
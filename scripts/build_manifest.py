@@ -0,0 +1,136 @@
+"""Content-hash build manifest shared by the site generators.
+Each generator records the hashes of its inputs (data files + its own source) and
+of the outputs it wrote under .build-cache/manifest/<name>.json. A later run with
+identical input hashes and untouched outputs is a no-op and can skip rendering."""
+
+import hashlib, json, os
+
+MANIFEST_DIR = '.build-cache/manifest'
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def input_hashes(paths):
+    return {os.path.relpath(p): file_hash(p) for p in paths}
+
+def _manifest_path(name):
+    return os.path.join(MANIFEST_DIR, f'{name}.json')
+
+def load_json(path, default=None):
+    """JSON from `path`, or `default` when the file is missing or unreadable."""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return default
+
+def load_entry(name):
+    return load_json(_manifest_path(name))
+
+def entry_names(prefix):
+    """Names of the recorded manifests that start with `prefix`, sorted."""
+    if not os.path.isdir(MANIFEST_DIR):
+        return []
+    return sorted(f[:-len('.json')] for f in os.listdir(MANIFEST_DIR)
+                  if f.startswith(prefix) and f.endswith('.json'))
+
+def forget(name):
+    """Delete a manifest whose generator output no longer exists."""
+    try:
+        os.remove(_manifest_path(name))
+    except FileNotFoundError:
+        pass
+
+def is_fresh(name, inputs):
+    """True when `inputs` (from input_hashes) match the last recorded build and
+    every recorded output is still on disk with the hash we wrote."""
+    entry = load_entry(name)
+    if not entry or entry.get("inputs") != inputs:
+        return False
+    stamps = entry.get("stamps", {})
+    return all(_output_intact(path, digest, stamps.get(path)) for path, digest in entry.get("outputs", {}).items())
+
+def _stamp(path):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+def _output_intact(path, digest, stamp):
+    """An output whose size and mtime match what record() saw is trusted without
+    re-reading it; anything else is re-hashed."""
+    try:
+        if stamp is not None and _stamp(path) == stamp:
+            return True
+        return file_hash(path) == digest
+    except FileNotFoundError:
+        return False
+
+def record(name, inputs, outputs, results=None):
+    """`outputs` is a list of paths to hash, or a {path: sha256} dict when the
+    writer already knows the digests (site_output.write_page returns them).
+    `results` is optional JSON kept alongside, such as per-file stage results."""
+    if not isinstance(outputs, dict):
+        outputs = input_hashes(outputs)
+    outputs = {os.path.relpath(p): h for p, h in outputs.items()}
+    stamps = {p: _stamp(p) for p in outputs if os.path.exists(p)}
+    entry = {"inputs": inputs, "outputs": outputs, "stamps": stamps}
+    if results is not None:
+        entry["results"] = results
+    _write(name, entry)
+
+def _write(name, entry):
+    os.makedirs(MANIFEST_DIR, exist_ok=True)
+    path = _manifest_path(name)
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w') as f:
+        # Compact dumps() goes through the C encoder; dump() and indent= do not, and
+        # cost the post-processing stages more than the pages they skip.
+        f.write(json.dumps(entry, sort_keys=True, separators=(',', ':')))
+    os.replace(tmp, path)
+
+def restamp(name, moves):
+    """Move outputs that were rewritten after `name` recorded them: `moves` maps a
+    path to (old sha256, new sha256), and a path recorded as old now counts as
+    new, stamped as it is on disk. Other paths keep their record."""
+    entry = load_entry(name)
+    if not entry:
+        return
+    outputs, stamps = entry.get("outputs", {}), entry.setdefault("stamps", {})
+    moved = False
+    for path, (old, new) in moves.items():
+        path = os.path.relpath(path)
+        if outputs.get(path) == old and os.path.exists(path):
+            outputs[path], stamps[path], moved = new, _stamp(path), True
+    if moved:
+        _write(name, entry)
+
+def dirty_items(name, items, verify=True):
+    """Per-item freshness for batched generators (one manifest entry, many pages).
+    `items` maps an item key to (input hash, output path). Returns the keys whose
+    input hash changed since the last record() or whose output is missing or was
+    modified, plus the previously recorded output hashes for reuse. Without
+    `verify` an output only has to exist, for outputs later steps rewrite."""
+    entry = load_entry(name) or {}
+    inputs, outputs, stamps = entry.get("inputs", {}), entry.get("outputs", {}), entry.get("stamps", {})
+    dirty = []
+    for key, (digest, path) in items.items():
+        path = os.path.relpath(path)
+        if inputs.get(key) != digest or path not in outputs \
+                or not (_output_intact(path, outputs[path], stamps.get(path)) if verify else os.path.exists(path)):
+            dirty.append(key)
+    return dirty, outputs
+
+def tracked_hashes(name, paths):
+    """input_hashes() for many files read on every run: a file whose size and
+    mtime match the last call under `name` keeps its recorded hash unread."""
+    entry = load_entry(name) or {}
+    known, stamps = entry.get("outputs", {}), entry.get("stamps", {})
+    hashes = {}
+    for path in paths:
+        rel = os.path.relpath(path)
+        hashes[rel] = known[rel] if rel in known and stamps.get(rel) == _stamp(path) else file_hash(path)
+    record(name, {}, hashes)
+    return hashes
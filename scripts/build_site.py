@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""Build the whole PE Collective site in one process tree.
+Runs every generator from .github/workflows/build-site.yml as a dependency DAG:
+generators whose prerequisites are done run concurrently in a process pool, so
+wall-clock time tracks the longest chain instead of the sum, and each worker pays
+the pandas/numpy import once for every generator it runs. Only a step that runs
+pays for its imports: generators are imported when their step starts, and heavy
+modules are imported inside the functions that need them, so a voices-only build
+never loads pandas. Each step's import time is reported (the "import" phase and
+its slowest top-level imports, as in `python -X importtime`). Once the generators
+are done, post-processing builds the deployed site in _site/ from site/ (copying,
+inline CSS extraction, CSS pruning, critical CSS, HTML minification), then the
+sitemap, then precompression; site/ keeps what the generators wrote.
+Scripts that are not in git are skipped, matching the old workflow steps.
+Every step is timed (see build_timing.py) and the combined report is written to
+.build-cache/build-report.json for diffing against earlier runs. The build cache
+is checked before the first step and sealed after the last (see build_cache.py),
+so CI can carry it from one run to the next. --watch serves site/ locally and
+rebuilds on every change under data/ and scripts/ (see watch.py)."""
+
+import importlib, os, runpy, sys, time
+from fnmatch import fnmatchcase
+
+import build_cache, build_timing, site_output
+
+REPORT_PATH = '.build-cache/build-report.json'
+
+# inputs/outputs document what each generator reads and writes; `after` is the
+# ordering the DAG enforces, and check_dag() rejects two steps that may run at once
+# while one writes what the other reads or writes. Generators with an `entry` are imported as modules
+# and called directly, the rest are executed as __main__ scripts.
+STEPS = [
+    {"name": "enrich_jobs", "script": "scripts/enrich_jobs.py",
+     "inputs": ["data/ai_jobs_*.csv"], "outputs": ["data/*.csv"], "after": []},
+    {"name": "merge_to_master", "script": "scripts/merge_to_master.py",
+     "inputs": ["data/*.csv"], "outputs": ["data/*.csv"], "after": ["enrich_jobs"]},
+    {"name": "job_board", "script": "scripts/generate_job_board.py",
+     "inputs": ["data/*.csv"], "outputs": ["site/jobs/index.html"], "after": ["merge_to_master"]},
+    {"name": "job_pages", "script": "scripts/generate_job_pages.py",
+     "inputs": ["data/*.csv"], "outputs": ["site/jobs/*/index.html"], "after": ["job_board"]},
+    {"name": "salary_pages", "script": "scripts/generate_salary_pages.py",
+     "inputs": ["data/*.csv"], "outputs": ["site/salaries/**/index.html"], "after": ["merge_to_master"]},
+    {"name": "category_pages", "script": "scripts/generate_category_pages.py",
+     "inputs": ["data/*.csv"], "outputs": ["site/jobs/*/index.html"], "after": ["job_pages"]},
+    {"name": "insights_page", "script": "scripts/generate_insights_page.py",
+     "inputs": ["data/*.csv"], "outputs": ["site/insights/index.html"], "after": ["merge_to_master"]},
+    {"name": "glossary_pages", "script": "scripts/generate_glossary_pages.py",
+     "inputs": ["data/*.json"], "outputs": ["site/glossary/**/index.html"], "after": []},
+    {"name": "comparison_pages", "script": "scripts/generate_comparison_pages.py",
+     "inputs": ["data/*.json"], "outputs": ["site/tools/**/index.html"], "after": []},
+    {"name": "top_voices", "script": "scripts/generate_top_voices.py", "entry": "generate",
+     "inputs": ["data/top_voices.json", "data/voices/*.json"], "outputs": ["site/voices/index.html"], "after": []},
+    {"name": "copy_site", "script": "scripts/site_pipeline.py", "entry": "copy_site",
+     "inputs": ["site/**/*"], "outputs": ["_site/**/*"],
+     "after": ["job_board", "job_pages", "salary_pages", "category_pages", "insights_page",
+               "glossary_pages", "comparison_pages", "top_voices"]},
+    {"name": "inline_css", "script": "scripts/extract_inline_css.py", "entry": "run",
+     "inputs": ["site/**/*.html"], "outputs": ["_site/**/*.html", "_site/assets/css/inline-*.css"],
+     "after": ["copy_site"]},
+    {"name": "prune_css", "script": "scripts/prune_css.py", "entry": "run",
+     "inputs": ["_site/**/*.html", "_site/assets/css/*.css", "_site/assets/js/*.js"],
+     "outputs": ["_site/**/*.html", "_site/assets/css/bundle-*.css", ".build-cache/css-bundles.json"],
+     "after": ["inline_css"]},
+    {"name": "critical_css", "script": "scripts/critical_css.py", "entry": "run",
+     "inputs": ["_site/**/*.html", "_site/assets/css/*.css"], "outputs": ["_site/**/*.html"],
+     "after": ["prune_css"]},
+    {"name": "minify_html", "script": "scripts/minify_site.py", "entry": "minify",
+     "inputs": ["_site/**/*.html"], "outputs": ["_site/**/*.html"], "after": ["critical_css"]},
+    {"name": "sitemap", "script": "scripts/generate_sitemap.py", "entry": "run",
+     "inputs": ["_site/**/*.html", "site/sitemap.xml", "data/sitemap_manifest.json"],
+     "outputs": ["_site/sitemap.xml", "_site/sitemap-*.xml.gz", "data/sitemap_manifest.json"],
+     "after": ["enrich_jobs", "merge_to_master", "job_board", "job_pages", "salary_pages",
+               "category_pages", "insights_page", "glossary_pages", "comparison_pages", "top_voices",
+               "copy_site", "inline_css", "prune_css", "critical_css", "minify_html"]},
+    {"name": "precompress", "script": "scripts/minify_site.py", "entry": "compress",
+     "inputs": ["_site/**/*"], "outputs": ["_site/**/*.gz", "_site/**/*.br"], "after": ["sitemap"]},
+]
+STEPS_BY_NAME = {s["name"]: s for s in STEPS}
+# Steps that build _site/ after the generators; watch mode leaves them to the next full build.
+POST_PROCESSING = {"copy_site", "inline_css", "prune_css", "critical_css", "minify_html", "sitemap", "precompress"}
+
+def _overlap(a, b):
+    """True when glob patterns `a` and `b` can name the same file (either matches
+    the other taken literally: site/jobs/*/index.html and site/jobs/ai/index.html)."""
+    return fnmatchcase(a, b) or fnmatchcase(b, a)
+
+def check_dag(steps):
+    names = {s["name"] for s in steps}
+    for s in steps:
+        unknown = set(s["after"]) - names
+        if unknown:
+            raise ValueError(f"{s['name']}: unknown prerequisite(s) {sorted(unknown)}")
+    done, remaining, ancestors = set(), list(steps), {}
+    while remaining:
+        ready = [s for s in remaining if set(s["after"]) <= done]
+        if not ready:
+            raise ValueError(f"dependency cycle among {sorted(s['name'] for s in remaining)}")
+        for s in ready:
+            ancestors[s["name"]] = set(s["after"]).union(*(ancestors[a] for a in s["after"]))
+        done.update(s["name"] for s in ready)
+        remaining = [s for s in remaining if s["name"] not in done]
+    for i, s in enumerate(steps):
+        for t in steps[i + 1:]:
+            if s["name"] in ancestors[t["name"]] or t["name"] in ancestors[s["name"]]:
+                continue
+            for writer, other in ((s, t), (t, s)):
+                for out in writer["outputs"]:
+                    clash = next((p for p in other["outputs"] + other["inputs"] if _overlap(out, p)), None)
+                    if clash:
+                        raise ValueError(f"{writer['name']} writes {out} and {other['name']} uses {clash}, "
+                                         f"but neither runs after the other")
+
+def run_step(name, force=False, profile_dir=None, jobs=None):
+    """Run one generator inside a pool worker (or, in watch mode, in this process).
+    Returns (status, seconds, detail, timing report). Workers are reused, so
+    per-step counters are reset first."""
+    step = STEPS_BY_NAME[name]
+    script = step["script"]
+    if not os.path.exists(script):
+        return "skipped", 0.0, "script not in git", None
+    build_timing.reset()
+    site_output.reset_stats()
+    status, detail = "ok", ""
+    profile = os.path.join(profile_dir, f'{name}.prof') if profile_dir else None
+    try:
+        with build_timing.profiled(profile), build_timing.imports_timed():
+            if step.get("entry"):
+                with build_timing.phase("import"):
+                    module = importlib.import_module(os.path.splitext(os.path.basename(script))[0])
+                getattr(module, step["entry"])(force=force, jobs=jobs)
+            else:
+                sys.argv = [script]
+                with build_timing.phase("run"):
+                    runpy.run_path(script, run_name='__main__')
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            status, detail = "failed", f"exit code {e.code}"
+    except Exception:
+        import traceback
+        status, detail = "failed", traceback.format_exc()
+    report = build_timing.report(name, site_output.stats)
+    return status, report["wall_seconds"], detail, report
+
+def import_summary(report, limit=3, min_seconds=0.002):
+    """"imports 0.052s: site_pipeline 0.031s, json 0.012s" for a step's report,
+    or '' when it loaded nothing new."""
+    seconds = (report or {}).get("phases", {}).get("import", {}).get("seconds", 0.0)
+    if seconds < min_seconds:
+        return ''
+    slowest = [f"{m} {s:.3f}s" for m, s in sorted(report.get("imports", {}).items(), key=lambda kv: -kv[1])[:limit]
+               if s >= min_seconds]
+    return f"imports {seconds:.3f}s" + (': ' + ', '.join(slowest) if slowest else '')
+
+def build(steps=STEPS, force=False, jobs=None, profile_dir=None):
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+    check_dag(steps)
+    pending = {s["name"]: s for s in steps}
+    done, running, results = set(), {}, {}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            for name in [n for n, s in pending.items() if set(s["after"]) <= done]:
+                del pending[name]
+                running[pool.submit(run_step, name, force, profile_dir, jobs)] = name
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                results[name] = future.result()
+                done.add(name)
+                status, seconds, detail, report = results[name]
+                imports = import_summary(report)
+                print(f"[{status:>7}] {name} ({seconds:.2f}s{'; ' + imports if imports else ''})"
+                      f"{' — ' + detail.strip() if detail else ''}")
+    return results
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description="Run every site generator as a parallel DAG.")
+    parser.add_argument('--force', action='store_true', help="regenerate even if inputs are unchanged")
+    parser.add_argument('--jobs', type=int, default=None, help="worker processes per pool, passed on to every step (default: CPU count; 1 builds serially)")
+    parser.add_argument('--report', metavar='PATH', default=REPORT_PATH, help=f"timing report (default: {REPORT_PATH})")
+    parser.add_argument('--profile', metavar='DIR', help="write a cProfile dump per generator to DIR")
+    parser.add_argument('--watch', action='store_true', help="serve site/ and rebuild on changes to data/ and scripts/")
+    parser.add_argument('--port', type=int, default=8000, help="port for --watch (default: 8000)")
+    args = parser.parse_args()
+    if args.watch:
+        import watch
+        watch.watch(args.port)
+        sys.exit(0)
+    start = time.perf_counter()
+    print(f"Build cache: {build_cache.check()}")
+    results = build(force=args.force, jobs=args.jobs, profile_dir=args.profile)
+    wall = time.perf_counter() - start
+    failed = [n for n, (status, *_) in results.items() if status == "failed"]
+    build_timing.write_report(args.report, {
+        "wall_seconds": round(wall, 4),
+        "steps": {n: report for n, (_, _, _, report) in sorted(results.items())},
+        "status": {n: status for n, (status, *_) in sorted(results.items())},
+    })
+    print(f"Built site in {wall:.2f}s ({len(failed)} failed); timing report: {args.report}; "
+          f"build cache: {build_cache.seal()} files sealed")
+    sys.exit(1 if failed else 0)
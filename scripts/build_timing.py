@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Build-time instrumentation shared by the site generators.
+Generators wrap their work in phase("load"), phase("render"), ... (or @timed) and
+site_output attributes its own render/write time. Phase times are exclusive:
+time spent in a nested phase is not counted again in the enclosing one, so the
+phases of a report add up to its wall time. report() bundles phase times with the
+pages written/skipped, bytes, peak RSS and any count() totals (e.g. CSS bytes
+saved). Under imports_timed(), loading modules is timed as the "import" phase and
+per top-level import, like the cumulative column of `python -X importtime`.
+Reports are JSON with sorted keys so two runs can be compared with:
+    python scripts/build_timing.py diff old.json new.json [--threshold 0.25]"""
+
+import builtins, json, os, resource, sys, time
+from contextlib import contextmanager
+from functools import wraps
+
+_phases = {}   # name -> [exclusive seconds, calls]
+_stack = []    # time already attributed to children of each open phase
+_counters = {} # name -> number, for non-timing results such as bytes saved
+_imports = {}  # top-level import -> seconds spent loading it and everything it imported
+_started = time.perf_counter()
+
+def reset():
+    global _started
+    _phases.clear()
+    _stack.clear()
+    _counters.clear()
+    _imports.clear()
+    _started = time.perf_counter()
+
+def _add(name, seconds, calls=1):
+    entry = _phases.setdefault(name, [0.0, 0])
+    entry[0] += seconds
+    entry[1] += calls
+
+@contextmanager
+def phase(name):
+    _stack.append(0.0)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        _add(name, elapsed - _stack.pop())
+        if _stack:
+            _stack[-1] += elapsed
+
+def timed(name):
+    """Decorator form of phase()."""
+    def decorate(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with phase(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+def add_time(name, seconds, calls=1):
+    """Attribute `seconds` measured inside the current phase to `name` instead."""
+    _add(name, seconds, calls)
+    if _stack:
+        _stack[-1] += seconds
+
+def timed_iter(chunks, name):
+    """Yield from `chunks`, attributing the time spent producing them to `name`.
+    Used for streamed pages, where rendering happens inside the write loop."""
+    spent, perf_counter = 0.0, time.perf_counter
+    it = iter(chunks)
+    try:
+        while True:
+            start = perf_counter()
+            try:
+                chunk = next(it)
+            except StopIteration:
+                spent += perf_counter() - start
+                return
+            spent += perf_counter() - start
+            yield chunk
+    finally:
+        add_time(name, spent)
+
+@contextmanager
+def imports_timed():
+    """Time every import statement in the block that loads a module not loaded
+    yet. Nested imports count towards the outermost one, and modules already in
+    sys.modules (e.g. inherited by a forked worker) cost nothing."""
+    original, depth = builtins.__import__, [0]
+    def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+        if depth[0] or level or name in sys.modules:
+            return original(name, globals, locals, fromlist, level)
+        depth[0] += 1
+        start = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            depth[0] -= 1
+            elapsed = time.perf_counter() - start
+            top = name.partition('.')[0]
+            _imports[top] = _imports.get(top, 0.0) + elapsed
+            add_time("import", elapsed)
+    builtins.__import__ = timed_import
+    try:
+        yield
+    finally:
+        builtins.__import__ = original
+
+def count(name, amount):
+    """Add `amount` to a named counter reported alongside the phases."""
+    _counters[name] = _counters.get(name, 0) + amount
+
+def peak_rss_kb():
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage // 1024 if sys.platform == 'darwin' else usage
+
+def report(name, pages=None):
+    """Timing report for everything measured since the last reset()."""
+    wall = time.perf_counter() - _started
+    phases = {k: {"seconds": round(v[0], 4), "calls": v[1]} for k, v in _phases.items()}
+    other = wall - sum(v[0] for v in _phases.values())
+    if other > 0.0005:
+        phases["other"] = {"seconds": round(other, 4), "calls": 1}
+    result = {"generator": name, "wall_seconds": round(wall, 4), "phases": phases,
+              "peak_rss_kb": peak_rss_kb()}
+    if pages is not None:
+        result.update(pages=pages["written"] + pages["skipped"], written=pages["written"],
+                      skipped=pages["skipped"], bytes=pages["bytes"])
+    if _imports:
+        result["imports"] = {k: round(v, 4) for k, v in sorted(_imports.items())}
+    if _counters:
+        result["counters"] = dict(sorted(_counters.items()))
+    return result
+
+def write_report(path, data):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+def cli(name, description, *steps, force_help, jobs_help="worker processes (default: CPU count)", pages=None):
+    """Command line shared by the generators and post-processing stages run as
+    scripts: --force, --jobs, --report and --profile, then each of `steps` called
+    with force= and jobs=. `pages` (site_output.stats) goes into the report."""
+    import argparse
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--force', action='store_true', help=force_help)
+    parser.add_argument('--jobs', type=int, default=None, help=jobs_help)
+    parser.add_argument('--report', metavar='PATH', help="write a JSON timing report")
+    parser.add_argument('--profile', metavar='PATH', help="write a cProfile dump")
+    args = parser.parse_args()
+    with profiled(args.profile):
+        for step in steps:
+            step(force=args.force, jobs=args.jobs)
+    if args.report:
+        write_report(args.report, report(name, pages))
+
+@contextmanager
+def profiled(path):
+    """cProfile everything in the block and dump pstats to `path` (no-op if None)."""
+    if not path:
+        yield
+        return
+    import cProfile
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        profiler.dump_stats(path)
+
+def _flatten(data, prefix=''):
+    """{"steps": {"voices": {"phases": {"load": {"seconds": 1}}}}} ->
+    {"voices.load": 1, ...} for every timing found in a single or combined report."""
+    if "generator" in data:
+        rows = {f'{prefix}{data["generator"]}': data["wall_seconds"]}
+        rows.update({f'{prefix}{data["generator"]}.{k}': v["seconds"] for k, v in data["phases"].items()})
+        return rows
+    rows = {}
+    if "wall_seconds" in data:
+        rows[f'{prefix}total'] = data["wall_seconds"]
+    for step in data.get("steps", {}).values():
+        if step:
+            rows.update(_flatten(step, prefix))
+    return rows
+
+def diff(old, new, threshold=0.25, min_seconds=0.05):
+    """Compare two reports. Returns (lines, regressions) where a regression is a
+    timing that grew by more than `threshold` and `min_seconds`."""
+    a, b = _flatten(old), _flatten(new)
+    lines, regressions = [], []
+    for key in sorted(a.keys() | b.keys()):
+        before, after = a.get(key), b.get(key)
+        if before is None or after is None:
+            fmt = lambda v: '-' if v is None else f'{v:.3f}'
+            lines.append(f'{key:<40}{fmt(before):>10}{fmt(after):>10}')
+            continue
+        change = (after - before) / before if before else 0.0
+        flag = ''
+        if after - before > min_seconds and change > threshold:
+            flag = '  REGRESSION'
+            regressions.append(key)
+        lines.append(f'{key:<40}{before:>10.3f}{after:>10.3f}{change:>+9.0%}{flag}')
+    return lines, regressions
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description="Compare two build timing reports.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    d = sub.add_parser('diff', help="show per-phase changes; exit 1 on regressions")
+    d.add_argument('old')
+    d.add_argument('new')
+    d.add_argument('--threshold', type=float, default=0.25, help="relative slowdown that fails (default 0.25)")
+    d.add_argument('--min-seconds', type=float, default=0.05, help="ignore changes smaller than this")
+    args = parser.parse_args()
+    with open(args.old) as f:
+        old = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+    lines, regressions = diff(old, new, args.threshold, args.min_seconds)
+    print(f'{"timing":<40}{"old":>10}{"new":>10}{"change":>9}')
+    print('\n'.join(lines))
+    sys.exit(1 if regressions else 0)
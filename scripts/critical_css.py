@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Inline the above-the-fold CSS of every built page and load the rest async.
+The rules of a page's blocking local stylesheets that can match its header, nav and
+first FOLD_CHARS of <main> are inlined as <style id="critical-css">, and the sheets
+switch to the media="print" onload swap with a <noscript> fallback. Work is memoized
+per template, and restore() undoes the rewrite."""
+
+import hashlib, os, re
+
+import build_manifest, css_rules, site_output, site_pipeline
+from build_timing import cli
+from site_output import summary
+from site_pipeline import BUILD_DIR, run_stage
+
+FOLD_CHARS = 4096
+SOURCES = [__file__, css_rules.__file__, build_manifest.__file__, site_output.__file__, site_pipeline.__file__]
+
+BLOCKING_RE = re.compile(r'<link rel="stylesheet" href="([^"]+)">')
+ASYNC_RE = re.compile(r'''<link rel="stylesheet" href="([^"]+)" media="print" onload="this.media='all'"><noscript><link rel="stylesheet" href="\1"></noscript>''')
+CRITICAL_RE = re.compile(r'<style id="critical-css">.*?</style>\s*', re.S)
+UNRENDERED_RE = re.compile(r'<!--.*?-->|<(script|style)\b[^>]*>.*?</\1>', re.S | re.I)
+SPACE_RE = re.compile(r'\s+')
+
+def restore(html):
+    """Undo a previous pass: drop the critical block, make the stylesheets blocking."""
+    return ASYNC_RE.sub(r'<link rel="stylesheet" href="\1">', CRITICAL_RE.sub('', html, count=1))
+
+def stylesheet_path(page, href):
+    """Local file for a stylesheet href on `page`, or None for external URLs."""
+    href = href.split('?', 1)[0].split('#', 1)[0]
+    if href.startswith(('http:', 'https:', '//', 'data:')) or not href.endswith('.css'):
+        return None
+    if href.startswith('/'):
+        return os.path.join(BUILD_DIR, href.lstrip('/'))
+    return os.path.normpath(os.path.join(os.path.dirname(page), href))
+
+def fold(html):
+    """Markup a first paint can show: the body up to FOLD_CHARS into <main>.
+    Measured without comments, scripts and runs of whitespace, so a page covers
+    the same markup before and after minify_site."""
+    html = SPACE_RE.sub(' ', UNRENDERED_RE.sub('', html))
+    body = html.find('<body')
+    main = html.find('<main', body)
+    end = (main if main >= 0 else body) + FOLD_CHARS
+    return html[body:end] if body >= 0 else html[:end]
+
+def _version(path):
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+class Stylesheets:
+    """Parsed stylesheets and critical subsets, cached per process. Entries are
+    keyed on file size and mtime, so an edited stylesheet is parsed again."""
+
+    def __init__(self):
+        self.parsed = {}
+        self.critical = {}
+
+    def rules(self, path):
+        key = (path, _version(path))
+        if key not in self.parsed:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.parsed[key] = css_rules.parse(f.read())
+        return self.parsed[key]
+
+    def critical_css(self, paths, tokens):
+        key = (tuple((p, _version(p)) for p in paths), tuple(frozenset(t) for t in tokens))
+        if key not in self.critical:
+            matches = css_rules.matcher(*tokens)
+            self.critical[key] = ''.join(css_rules.serialize(css_rules.filter_rules(self.rules(p), matches))
+                                         for p in paths)
+        return self.critical[key]
+
+def inline_critical(page, html, sheets):
+    """Return the page with critical CSS inlined, or None when nothing applies."""
+    html = restore(html)
+    head_end = html.find('</head>')
+    if head_end < 0:
+        return None
+    links = [(m, stylesheet_path(page, m.group(1))) for m in BLOCKING_RE.finditer(html, 0, head_end)]
+    links = [(m, path) for m, path in links if path and os.path.exists(path)]
+    if not links:
+        return None
+    critical = sheets.critical_css(tuple(path for _, path in links), css_rules.page_tokens(fold(html)))
+    out, pos = [], 0
+    for i, (m, _) in enumerate(links):
+        out.append(html[pos:m.start()])
+        if not i:
+            # Repeat the link's indentation, so minified pages stay minified.
+            indent = html[html.rfind('\n', 0, m.start()) + 1:m.start()]
+            out.append(f'<style id="critical-css">{critical}</style>\n{indent if not indent.strip() else ""}')
+        href = m.group(1)
+        out.append(f'''<link rel="stylesheet" href="{href}" media="print" onload="this.media='all'"><noscript><link rel="stylesheet" href="{href}"></noscript>''')
+        pos = m.end()
+    out.append(html[pos:])
+    return ''.join(out)
+
+SHEETS = Stylesheets()
+
+def inline_page(page, html):
+    """Pipeline stage: the page with critical CSS inlined, and a short hash of the
+    critical block (None when the page has no local stylesheets)."""
+    new_html = inline_critical(page, html, SHEETS)
+    if new_html is None:
+        return None, None
+    return new_html, hashlib.md5(CRITICAL_RE.search(new_html).group().encode()).hexdigest()[:8]
+
+def run(force=False, jobs=None):
+    css_files = sorted(os.path.join(d, f) for d, _, fs in os.walk(os.path.join(BUILD_DIR, 'assets', 'css'))
+                       for f in fs if f.endswith('.css'))
+    results, processed, rewritten = run_stage('critical-css', inline_page, SOURCES + css_files, FOLD_CHARS,
+                                              force=force, jobs=jobs, upstream=['prune-scan'])
+    inlined = sum(1 for p in processed if results[os.path.relpath(p)])
+    blocks = {block for block in results.values() if block}
+    print(f"Critical CSS: {inlined} pages inlined ({len(rewritten)} changed), "
+          f"{len(results) - len(processed)} unchanged; {len(blocks)} distinct critical blocks; {summary()}")
+
+if __name__ == '__main__':
+    cli('critical_css', "Inline above-the-fold CSS and load full stylesheets async.", run,
+        force_help="reprocess every page, not only changed ones", pages=site_output.stats)
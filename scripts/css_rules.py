@@ -0,0 +1,201 @@
+"""Minimal CSS rule handling for the site/ post-processing stages.
+Not a full CSS parser: enough to split a stylesheet into rules (descending into
+@media/@supports blocks), keep the rules whose selectors can match a page's tags,
+classes and ids, and serialize the result minified. Selector matching is
+deliberately conservative: pseudo-classes, pseudo-elements and attribute tests are
+ignored, so a rule is only dropped when a class, id or tag it needs is absent."""
+
+import re
+
+# At-rules whose block holds more rules; every other block is a declaration
+# block (or opaque, like @keyframes and @font-face) and is kept verbatim.
+NESTED_AT = {'@media', '@supports', '@layer', '@container', '@document'}
+
+COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_TOKEN_RE = re.compile(r'''[{};]|"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*\'''')
+_PSEUDO_RE = re.compile(r'::?[-\w]+(\((?:[^()]|\([^()]*\))*\))?')
+_ATTR_RE = re.compile(r'\[[^\]]*\]')
+_SIMPLE_RE = re.compile(r'([.#]?)((?:-?[_a-zA-Z]|\\.)(?:[-\w]|\\.)*)')
+_ESCAPE_RE = re.compile(r'\\(.)')
+_STRING_RE = re.compile(r'''("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')''')
+_SPACE_RE = re.compile(r'\s+')
+_SELECTOR_SPACE_RE = re.compile(r'\s*([,>])\s*')
+_DECL_SPACE_RE = re.compile(r'\s*([;:{},])\s*')
+
+_TAG_RE = re.compile(r'<([a-zA-Z][\w-]*)')
+_CLASS_RE = re.compile(r'''\sclass\s*=\s*(?:"([^"]*)"|'([^']*)')''')
+_ID_RE = re.compile(r'''\sid\s*=\s*(?:"([^"]*)"|'([^']*)')''')
+
+class Rule:
+    """`prelude {body}` for a style rule or opaque at-rule, `prelude {children}`
+    for a nested at-rule, or a bare `prelude;` statement (body and children None)."""
+    __slots__ = ('prelude', 'body', 'children')
+
+    def __init__(self, prelude, body=None, children=None):
+        self.prelude = prelude
+        self.body = body
+        self.children = children
+
+    @property
+    def at_keyword(self):
+        return self.prelude.split(None, 1)[0].split('(')[0].lower() if self.prelude.startswith('@') else None
+
+def parse(css):
+    """Split a stylesheet into a list of Rules."""
+    return _parse(COMMENT_RE.sub('', css), 0)[0]
+
+def _parse(css, pos):
+    rules, start = [], pos
+    while True:
+        m = _TOKEN_RE.search(css, pos)
+        if not m:
+            return rules, len(css)
+        token, pos = m.group(), m.end()
+        if token[0] in '"\'':
+            continue
+        if token == '}':
+            return rules, pos
+        prelude = css[start:m.start()].strip()
+        if token == ';':
+            if prelude:
+                rules.append(Rule(prelude))
+        elif prelude.startswith('@') and prelude.split(None, 1)[0].lower() in NESTED_AT:
+            children, pos = _parse(css, pos)
+            rules.append(Rule(prelude, children=children))
+        else:
+            end = _block_end(css, pos)
+            rules.append(Rule(prelude, body=css[pos:end].strip()))
+            pos = end + 1
+        start = pos
+
+def _block_end(css, pos):
+    """Index of the '}' closing the block that starts at `pos`."""
+    depth = 1
+    while True:
+        m = _TOKEN_RE.search(css, pos)
+        if not m:
+            return len(css)
+        token, pos = m.group(), m.end()
+        if token == '{':
+            depth += 1
+        elif token == '}':
+            depth -= 1
+            if not depth:
+                return m.start()
+
+def split_selectors(prelude):
+    """Split a selector list on top-level commas (not those inside :is(...))."""
+    parts, depth, start = [], 0, 0
+    for i, ch in enumerate(prelude):
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch == ',' and not depth:
+            parts.append(prelude[start:i].strip())
+            start = i + 1
+    parts.append(prelude[start:].strip())
+    return [p for p in parts if p]
+
+def selector_needs(selector):
+    """(tags, classes, ids) a selector needs present to match anything."""
+    tags, classes, ids = set(), set(), set()
+    bare = _ATTR_RE.sub(' ', _PSEUDO_RE.sub(' ', selector))
+    for prefix, name in _SIMPLE_RE.findall(bare):
+        name = _ESCAPE_RE.sub(r'\1', name)
+        if prefix == '.':
+            classes.add(name)
+        elif prefix == '#':
+            ids.add(name)
+        else:
+            tags.add(name.lower())
+    return tags, classes, ids
+
+def page_tokens(html):
+    """(tags, classes, ids) used by an HTML fragment."""
+    tags = {t.lower() for t in _TAG_RE.findall(html)}
+    classes = {c for a, b in _CLASS_RE.findall(html) for c in (a or b).split()}
+    ids = {a or b for a, b in _ID_RE.findall(html)}
+    return tags, classes, ids
+
+def matcher(tags, classes, ids):
+    """Selector predicate for a set of tokens, memoized per selector."""
+    cache = {}
+    def matches(selector):
+        hit = cache.get(selector)
+        if hit is None:
+            need_tags, need_classes, need_ids = selector_needs(selector)
+            hit = cache[selector] = need_tags <= tags and need_classes <= classes and need_ids <= ids
+        return hit
+    return matches
+
+def filter_rules(rules, matches):
+    """Rules (and selectors within a rule) that `matches` accepts. Nested at-rules
+    are kept when any child survives; @keyframes only when a kept rule names them."""
+    kept = _filter(rules, matches)
+    used = ' '.join(_bodies(kept))
+    return _drop_keyframes(kept, used)
+
+def _filter(rules, matches):
+    kept = []
+    for rule in rules:
+        if rule.children is not None:
+            children = _filter(rule.children, matches)
+            if children:
+                kept.append(Rule(rule.prelude, children=children))
+        elif rule.body is None or rule.prelude.startswith('@'):
+            kept.append(rule)
+        else:
+            selectors = [s for s in split_selectors(rule.prelude) if matches(s)]
+            if selectors:
+                kept.append(Rule(','.join(selectors), body=rule.body))
+    return kept
+
+def _bodies(rules):
+    for rule in rules:
+        if rule.children is not None:
+            yield from _bodies(rule.children)
+        elif rule.body is not None and rule.at_keyword != '@keyframes':
+            yield rule.body
+
+def _drop_keyframes(rules, used):
+    kept = []
+    for rule in rules:
+        if rule.children is not None:
+            children = _drop_keyframes(rule.children, used)
+            if children:
+                kept.append(Rule(rule.prelude, children=children))
+        elif rule.at_keyword in ('@keyframes', '@-webkit-keyframes'):
+            name = rule.prelude.split(None, 1)[1].strip() if ' ' in rule.prelude else ''
+            if name and re.search(rf'(?<![-\w]){re.escape(name)}(?![-\w])', used):
+                kept.append(rule)
+        else:
+            kept.append(rule)
+    return kept
+
+def _outside_strings(text, squeeze):
+    """Apply `squeeze` to the parts of `text` that are not string literals."""
+    parts = _STRING_RE.split(text)
+    return ''.join(part if i % 2 else squeeze(part) for i, part in enumerate(parts))
+
+def _minify_prelude(prelude):
+    return _outside_strings(prelude, lambda t: _SELECTOR_SPACE_RE.sub(r'\1', _SPACE_RE.sub(' ', t)))
+
+def _minify_body(body):
+    return _outside_strings(body, lambda t: _DECL_SPACE_RE.sub(r'\1', _SPACE_RE.sub(' ', t))).rstrip(';')
+
+def serialize(rules):
+    """Minified CSS text for a list of Rules."""
+    out = []
+    for rule in rules:
+        prelude = _minify_prelude(rule.prelude)
+        if rule.children is not None:
+            out.append(f'{prelude}{{{serialize(rule.children)}}}')
+        elif rule.body is None:
+            out.append(f'{prelude};')
+        else:
+            out.append(f'{prelude}{{{_minify_body(rule.body)}}}')
+    return ''.join(out)
+
+def minify(css):
+    return serialize(parse(css))
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Move inline <style> blocks out of the pages into shared CSS files.
+The first post-processing stage, from site/ into _site/: each block of at least
+MIN_BYTES becomes _site/assets/css/inline-<md5>.css, linked in its place so the
+cascade is unchanged, and pages with the same block share the file. A sheet no page
+links any more is deleted unless it is hand-made. GitHub Pages cannot be told the
+hashed names are immutable, so they get its default cache lifetime."""
+
+import hashlib, os, re, textwrap
+
+import build_manifest, site_output, site_pipeline
+from build_manifest import load_entry
+from build_timing import cli
+from site_output import summary, write_text
+from site_pipeline import BUILD_DIR, SITE_DIR, run_stage
+
+STAGE = 'inline-css'
+CSS_DIR = f'{BUILD_DIR}/assets/css'
+SOURCE_CSS_DIR = f'{SITE_DIR}/assets/css'
+CSS_URL = '/assets/css'
+MIN_BYTES = 512
+SOURCES = [__file__, build_manifest.__file__, site_output.__file__, site_pipeline.__file__]
+
+STYLE_RE = re.compile(r'<style>(.*?)</style>', re.S)
+
+def css_name(css):
+    return f'inline-{hashlib.md5(css.encode()).hexdigest()[:8]}.css'
+
+def extract(html):
+    """Return (html with large <style> blocks replaced by <link>s, {filename: css})."""
+    sheets = {}
+    def replace(match):
+        body = match.group(1)
+        if len(body) < MIN_BYTES:
+            return match.group(0)
+        css = textwrap.dedent(body).strip() + '\n'
+        name = css_name(css)
+        sheets[name] = css
+        return f'<link rel="stylesheet" href="{CSS_URL}/{name}">'
+    return STYLE_RE.sub(replace, html), sheets
+
+def extract_page(page, html):
+    """Pipeline stage: write the page's large blocks out and link them."""
+    new_html, sheets = extract(html)
+    for name, css in sorted(sheets.items()):
+        write_text(os.path.join(CSS_DIR, name), css)
+    return (new_html if sheets else None), {"sheets": sorted(sheets), "moved": len(html) - len(new_html)}
+
+def remove_unlinked(previous, sheets):
+    """Delete the sheets earlier runs wrote (from their `previous` results) that no
+    page links now, leaving the hand-made ones from site/ alone. Returns the count."""
+    removed = 0
+    for name in sorted({name for r in previous.values() for name in r["sheets"]} - sheets):
+        path = os.path.join(CSS_DIR, name)
+        if os.path.exists(path) and not os.path.exists(os.path.join(SOURCE_CSS_DIR, name)):
+            os.remove(path)
+            removed += 1
+    return removed
+
+def run(force=False, jobs=None):
+    previous = (load_entry(f'post-{STAGE}') or {}).get("results", {})
+    results, processed, rewritten = run_stage(STAGE, extract_page, SOURCES, MIN_BYTES,
+                                              force=force, jobs=jobs, src=SITE_DIR)
+    sheets = {name for r in results.values() for name in r["sheets"]}
+    removed = remove_unlinked(previous, sheets)
+    moved = sum(results[os.path.relpath(p)]["moved"] for p in processed)
+    print(f"Inline CSS: {len(rewritten)} pages rewritten, {len(results) - len(processed)} unchanged; "
+          f"{len(sheets)} stylesheets ({removed} removed), {moved:,} bytes moved out of HTML; {summary()}")
+
+if __name__ == '__main__':
+    cli('inline_css', "Extract inline <style> blocks into hashed CSS files.", run,
+        force_help="reprocess every page, not only changed ones", pages=site_output.stats)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Generate _site/sitemap.xml with lastmod dates that follow real content changes.
+data/sitemap_manifest.json keeps a hash of each URL's <main> content, and lastmod
+moves only when it changes; the first run seeds it from site/sitemap.xml. Noindex,
+redirect and non-canonical pages are left out. Past SPLIT_URLS URLs it becomes an
+index over gzipped per-section sitemaps within the protocol limits."""
+
+import collections, datetime, hashlib, json, os, re, zlib
+
+import build_manifest, site_output, site_pipeline
+from build_timing import cli, phase
+from critical_css import SPACE_RE, UNRENDERED_RE
+from page_shell import BASE_URL
+from site_output import summary, write_page, write_text
+from site_pipeline import BUILD_DIR, SITE_DIR, run_stage
+
+SITEMAP = f'{BUILD_DIR}/sitemap.xml'
+SEED = f'{SITE_DIR}/sitemap.xml'
+MANIFEST_JSON = 'data/sitemap_manifest.json'
+SPLIT_URLS = 1000
+MAX_URLS = 50_000  # per sitemap file, from the sitemaps.org protocol
+MAX_BYTES = 50 * 1024 * 1024  # per sitemap file, uncompressed
+SECTIONS = ('jobs', 'tools', 'glossary', 'blog', 'voices', 'salaries')
+DEFAULT_CHANGEFREQ = 'weekly'
+DEFAULT_PRIORITY = '0.5'
+SOURCES = [__file__, build_manifest.__file__, site_output.__file__, site_pipeline.__file__]
+
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n'
+XMLNS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+
+def escape(text):
+    """&, < and > as XML entities, like xml.sax.saxutils.escape, which would cost
+    this stage more to import (it pulls in urllib and email) than to run."""
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+NOINDEX_RE = re.compile(r'''<meta\s+name=["']robots["']\s+content=["'][^"']*noindex''', re.I)
+REFRESH_RE = re.compile(r'''<meta\s+http-equiv=["']refresh["']''', re.I)
+CANONICAL_RE = re.compile(r'<link rel="canonical" href="([^"]+)"')
+CONTENT_RE = re.compile(r'<main\b.*?</main>|<body\b.*?</body>', re.S)
+URL_RE = re.compile(r'<url>\s*<loc>([^<]+)</loc>\s*(?:<lastmod>([^<]+)</lastmod>)?\s*'
+                    r'(?:<changefreq>([^<]+)</changefreq>)?\s*(?:<priority>([^<]+)</priority>)?')
+SECTION_FILE_RE = re.compile(r'sitemap-[\w-]+\.xml(\.gz)?$')
+
+def page_url(page):
+    """Site-relative URL of a page: _site/jobs/x/index.html -> /jobs/x/."""
+    path = '/' + os.path.relpath(page, BUILD_DIR).replace(os.sep, '/')
+    return path[:-len('index.html')] if path.endswith('/index.html') else path
+
+def section(url):
+    first = url.strip('/').split('/', 1)[0]
+    return first if first in SECTIONS else 'pages'
+
+def content_hash(page, html):
+    """Pipeline stage: hash of the page's rendered content, or None when the page
+    stays out of the sitemap."""
+    canonical = CANONICAL_RE.search(html)
+    if NOINDEX_RE.search(html) or REFRESH_RE.search(html) \
+            or (canonical and canonical.group(1) != BASE_URL + page_url(page)):
+        return None, None
+    m = CONTENT_RE.search(html)
+    content = SPACE_RE.sub(' ', UNRENDERED_RE.sub('', m.group() if m else html))
+    return None, hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+def seed(path=SEED):
+    """Manifest entries (without hashes) from an existing single-document sitemap."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            xml = f.read()
+    except FileNotFoundError:
+        return {}
+    return {loc[len(BASE_URL):]: {"hash": None, "lastmod": lastmod, "changefreq": changefreq, "priority": priority}
+            for loc, lastmod, changefreq, priority in URL_RE.findall(xml) if loc.startswith(BASE_URL)}
+
+def section_defaults(manifest):
+    """The most common (changefreq, priority) per section, for new URLs."""
+    seen = collections.defaultdict(collections.Counter)
+    for url, entry in manifest.items():
+        seen[section(url)][(entry["changefreq"], entry["priority"])] += 1
+    return {name: counts.most_common(1)[0][0] for name, counts in seen.items()}
+
+def url_xml(url, entry):
+    return (f'  <url>\n    <loc>{escape(BASE_URL + url)}</loc>\n    <lastmod>{entry["lastmod"]}</lastmod>\n'
+            f'    <changefreq>{entry["changefreq"]}</changefreq>\n    <priority>{entry["priority"]}</priority>\n  </url>\n')
+
+URLSET_OPEN = f'{XML_HEADER}<urlset xmlns="{XMLNS}">\n'
+URLSET_CLOSE = '</urlset>\n'
+
+def urlset(urls, manifest):
+    yield URLSET_OPEN
+    for url in urls:
+        yield url_xml(url, manifest[url])
+    yield URLSET_CLOSE
+
+def gzipped(chunks):
+    """Gzip a stream of str chunks as it is produced. zlib's gzip header carries
+    no timestamp, so identical input gives identical bytes."""
+    z = zlib.compressobj(9, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = z.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield z.flush()
+
+def write_sitemaps(prefix, entries):
+    """Stream `entries` ((url, manifest entry) pairs) into _site/<prefix>.xml.gz,
+    rolling over to <prefix>-2.xml.gz, ... at MAX_URLS or MAX_BYTES. Holds one
+    entry at a time. Returns [(filename, latest lastmod)]."""
+    entries = iter(entries)
+    pending = next(entries, None)
+    sitemaps = []
+    while pending is not None:
+        filename = f'{prefix}.xml.gz' if not sitemaps else f'{prefix}-{len(sitemaps) + 1}.xml.gz'
+        latest = ['']
+        def chunks():
+            nonlocal pending
+            yield URLSET_OPEN
+            count, size = 0, len(URLSET_OPEN) + len(URLSET_CLOSE)
+            while pending is not None:
+                xml = url_xml(*pending)
+                size += len(xml.encode('utf-8'))
+                if count == MAX_URLS or (count and size > MAX_BYTES):
+                    break
+                yield xml
+                count += 1
+                latest[0] = max(latest[0], pending[1]["lastmod"])
+                pending = next(entries, None)
+            yield URLSET_CLOSE
+        write_page(os.path.join(BUILD_DIR, filename), gzipped(chunks()), encoding=None)
+        sitemaps.append((filename, latest[0]))
+    return sitemaps
+
+def sitemap_index(sitemaps):
+    """`sitemaps` is [(filename, lastmod)]."""
+    yield f'{XML_HEADER}<sitemapindex xmlns="{XMLNS}">\n'
+    for name, lastmod in sitemaps:
+        yield f'  <sitemap>\n    <loc>{escape(f"{BASE_URL}/{name}")}</loc>\n    <lastmod>{lastmod}</lastmod>\n  </sitemap>\n'
+    yield '</sitemapindex>\n'
+
+def run(force=False, jobs=None):
+    today = datetime.date.today().isoformat()
+    hashes = run_stage('sitemap', content_hash, SOURCES, force=force, jobs=jobs)[0]
+    previous = build_manifest.load_json(MANIFEST_JSON)
+    if previous is None:
+        previous = seed()
+    defaults = section_defaults(previous)
+    manifest, added, changed = {}, 0, 0
+    with phase("diff"):
+        for page, digest in hashes.items():
+            if digest is None:
+                continue
+            url = page_url(page)
+            old = previous.get(url)
+            if old is None:
+                changefreq, priority = defaults.get(section(url), (DEFAULT_CHANGEFREQ, DEFAULT_PRIORITY))
+                old = {"hash": digest, "lastmod": today, "changefreq": changefreq, "priority": priority}
+                added += 1
+            elif old["hash"] not in (None, digest):
+                old = {**old, "lastmod": today}
+                changed += 1
+            manifest[url] = {**old, "hash": digest}
+    urls = sorted(manifest)
+    written = set()
+    with phase("write"):
+        if len(urls) <= SPLIT_URLS:
+            write_page(SITEMAP, urlset(urls, manifest))
+        else:
+            by_section = collections.defaultdict(list)
+            for url in urls:
+                by_section[section(url)].append(url)
+            sitemaps = []
+            for name, members in sorted(by_section.items()):
+                sitemaps += write_sitemaps(f'sitemap-{name}', ((url, manifest[url]) for url in members))
+            written.update(filename for filename, _ in sitemaps)
+            write_page(SITEMAP, sitemap_index(sitemaps))
+        for name in os.listdir(BUILD_DIR):
+            if SECTION_FILE_RE.match(name) and name not in written:
+                os.remove(os.path.join(BUILD_DIR, name))
+        write_text(MANIFEST_JSON, json.dumps(manifest, indent=2, sort_keys=True) + '\n')
+    removed = len(set(previous) - set(manifest))
+    print(f"Sitemap: {len(urls)} URLs in {len(written) or 1} sitemap(s); {changed} changed, {added} new, "
+          f"{removed} removed; {summary()}")
+
+if __name__ == '__main__':
+    cli('sitemap', "Generate sitemap.xml with content-based lastmod dates.", run,
+        force_help="re-hash every page, not only changed ones", pages=site_output.stats)
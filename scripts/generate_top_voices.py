@@ -1,182 +1,216 @@
 #!/usr/bin/env python3
-"""Generate Top 25 Prompt Engineering Voices page for PE Collective.
-Standalone generator — reads data/top_voices.json, writes site/voices/index.html.
-Matches existing site HTML structure from about/index.html pattern."""
+"""Generate the Top Voices pages for PE Collective.
+Standalone generator — reads data/top_voices.json (the flagship list, /voices/) and
+every data/voices/<slug>.json (yearly archives and niche lists, /voices/<slug>/),
+writes one page per list, an archive index at /voices/archive/ and a profile page
+per voice at /voices/<voice-slug>/. The page of a deleted list file and the
+profile of a voice that no longer appears on any list are deleted.
+Matches existing site HTML structure from about/index.html pattern; the shared
+head, header, nav and footer come from the cached shell in page_shell.py.
+Unchanged lists and profiles are skipped via the build manifest; changed ones
+render in a process pool, each worker reusing the shell compiled before the pool
+forked."""
 
-import json, os
+import glob, hashlib, json, os, string
+from itertools import chain, repeat
+from operator import attrgetter
 
-BASE_URL = "https://pecollective.com"
-SITE_NAME = "PE Collective"
+import icons, page_shell, site_output, structured_data, voices_data
+from build_manifest import dirty_items, entry_names, forget, input_hashes, is_fresh, load_entry, record
+from build_timing import cli, phase, timed
+from page_shell import BASE_URL, SITE_NAME, compile_shell, iter_page
+from site_output import summary, write_page
+from voices_data import load_list
 
-def load_voices():
-    with open('data/top_voices.json', 'r') as f:
-        return json.load(f)
+VOICES_JSON = 'data/top_voices.json'
+LISTS_DIR = 'data/voices'
+ARCHIVE_URL = '/voices/archive/'
+# List file names that would collide with the archive page or the profiles manifest.
+RESERVED_LISTS = ('archive', 'profiles')
+PROFILE_BATCH = 64
+PROFILE_POOL_MIN = 256  # below this many dirty profiles, pool startup costs more than it saves
+CARD_BATCH = 256  # cards per chunk from voice_cards(); larger chunks fall out of cache
+SOURCES = [__file__, icons.__file__, page_shell.__file__, site_output.__file__, structured_data.__file__,
+           voices_data.__file__]
 
-def voice_card(v):
-    tags = ''.join(f'<span class="voice-tag">{t}</span>' for t in v.get("tags", []))
-    rc = "voice-rank-top" if v["rank"] <= 3 else "voice-rank"
-    return f'''<div class="voice-card" id="voice-{v["rank"]}">
+# Section copy per tier; a list file can override it with a "tiers" entry.
+TIER_COPY = {
+    "leader": ("Top {count} Leaders", "The most recognized voices shaping prompt engineering and AI engineering."),
+    "rising": ("Rising Voices ({first}-{last})", "Educators, builders, and thought leaders gaining momentum."),
+}
+
+VOICES_STYLE = '''
+  <style>
+.voices-hero { text-align: center; padding: var(--space-4xl) 0 var(--space-2xl); }
+.voices-hero .eyebrow { color: var(--color-gold); font-size: 0.85rem; font-weight: 600; text-transform: uppercase; letter-spacing: 0.08em; margin-bottom: 0.75rem; }
+.voices-hero h1 { font-family: var(--font-display); font-size: clamp(1.75rem, 4vw, 2.5rem); font-weight: 700; margin-bottom: 0.75rem; }
+.voices-subtitle { font-size: 1.1rem; color: var(--color-text-secondary); margin-bottom: 0.5rem; }
+.voices-meta { font-size: 0.85rem; color: var(--color-text-muted); }
+.voices-content { max-width: 800px; margin: 0 auto; padding: 0 1.5rem var(--space-3xl); }
+.voice-methodology { margin-bottom: var(--space-xl); border: 1px solid rgba(255,255,255,0.08); border-radius: var(--radius-lg); background: var(--color-bg-card); }
+.voice-methodology summary { padding: 1rem 1.25rem; cursor: pointer; color: var(--color-text-primary); font-weight: 600; }
+.voice-methodology summary:hover { color: var(--color-gold); }
+.methodology-content { padding: 0 1.25rem 1.25rem; font-size: 0.9rem; color: var(--color-text-secondary); line-height: 1.7; }
+.methodology-content ul { padding-left: 1.25rem; margin: 0.75rem 0; }
+.methodology-content li { margin-bottom: 0.5rem; }
+.voices-jump-nav { display: flex; flex-wrap: wrap; gap: 0.25rem; margin-bottom: var(--space-xl); padding: 0.75rem; background: var(--color-bg-card); border: 1px solid rgba(255,255,255,0.08); border-radius: var(--radius-lg); }
+.voice-jump-link { font-size: 0.75rem; font-family: monospace; padding: 0.25rem 0.5rem; border-radius: 6px; color: var(--color-text-muted); text-decoration: none; transition: background 0.15s, color 0.15s; }
+.voice-jump-link:hover { background: var(--color-gold); color: var(--color-bg-dark); }
+.voices-section-heading { font-family: var(--font-display); font-size: 1.3rem; margin-bottom: 0.5rem; padding-bottom: 0.5rem; border-bottom: 2px solid var(--color-gold); }
+.voices-grid { display: flex; flex-direction: column; gap: 1rem; margin-bottom: var(--space-2xl); }
+.voice-card { border: 1px solid rgba(255,255,255,0.08); border-radius: var(--radius-lg); background: var(--color-bg-card); padding: 1.25rem; transition: border-color 0.25s, box-shadow 0.25s; }
+.voice-card:hover { border-color: var(--color-gold); box-shadow: var(--shadow-glow); }
+.voice-card-header { display: flex; align-items: flex-start; gap: 0.75rem; }
+.voice-rank, .voice-rank-top { font-family: monospace; font-weight: 700; font-size: 1.1rem; min-width: 2.5rem; text-align: center; flex-shrink: 0; color: var(--color-text-muted); }
+.voice-rank-top { color: var(--color-gold-light); font-size: 1.25rem; }
+.voice-card-info { flex: 1; min-width: 0; }
+.voice-name { font-size: 1.1rem; font-weight: 600; margin: 0 0 0.25rem; }
+.voice-name a { color: var(--color-text-primary); text-decoration: none; }
+.voice-name a:hover { color: var(--color-gold-light); }
+.voice-title { font-size: 0.85rem; color: var(--color-text-secondary); margin: 0 0 0.5rem; }
+.voice-tags { display: flex; flex-wrap: wrap; gap: 0.35rem; }
+.voice-tag { font-size: 0.7rem; font-family: monospace; padding: 0.15rem 0.5rem; border-radius: 999px; background: rgba(232,168,124,0.1); color: var(--color-gold); font-weight: 500; }
+.voice-linkedin-btn { flex-shrink: 0; display: flex; align-items: center; justify-content: center; width: 2.25rem; height: 2.25rem; border-radius: 6px; color: var(--color-text-muted); text-decoration: none; }
+.voice-linkedin-btn:hover { color: #0077B5; background: rgba(0,119,181,0.15); }
+.voice-bio { margin: 0.75rem 0 0; font-size: 0.9rem; color: var(--color-text-secondary); line-height: 1.7; padding-left: calc(2.5rem + 0.75rem); }
+.voices-share-cta { text-align: center; padding: var(--space-xl) 1.5rem; max-width: 600px; margin: 0 auto; }
+.voices-share-cta h2 { font-family: var(--font-display); font-size: 1.3rem; margin-bottom: 0.5rem; }
+.voices-share-cta p { color: var(--color-text-secondary); margin-bottom: 0.5rem; }
+@media (max-width: 640px) { .voice-bio { padding-left: 0; } .voice-card-header { flex-wrap: wrap; } .voice-card { position: relative; } .voice-linkedin-btn { position: absolute; top: 1rem; right: 1rem; } .voices-jump-nav { display: none; } }
+  </style>'''
+
+LINKEDIN_ICON = icons.icon("linkedin")
+ICON_SPRITE = icons.sprite("linkedin")
+
+# Archive and profile pages have no rank column to indent the bio past.
+FLAT_STYLE = VOICES_STYLE.replace('padding-left: calc(2.5rem + 0.75rem)', 'padding-left: 0')
+
+@timed("load")
+def load_voices(path=VOICES_JSON):
+    return load_list(path)
+
+def discover_lists():
+    """(json path, url) for the flagship list and every data/voices/*.json."""
+    lists = [(VOICES_JSON, '/voices/')]
+    for path in sorted(glob.glob(os.path.join(LISTS_DIR, '*.json'))):
+        slug = os.path.splitext(os.path.basename(path))[0]
+        if slug in RESERVED_LISTS:
+            raise ValueError(f'{path}: "{slug}" is a reserved name; rename the list file')
+        lists.append((path, f'/voices/{slug}/'))
+    return lists
+
+def output_path(url):
+    return os.path.join('site', url.strip('/'), 'index.html')
+
+def manifest_name(url):
+    return '-'.join(['voices'] + [p for p in url.strip('/').split('/')[1:]])
+
+# One card; voice_card() formats it and the columnar renderer below splits it at
+# its fields, so the two cannot drift apart.
+CARD_TEMPLATE = '''<div class="voice-card" id="voice-{rank}">
   <div class="voice-card-header">
-    <div class="{rc}">#{v["rank"]}</div>
+    <div class="{rank_class}">#{rank}</div>
     <div class="voice-card-info">
-      <h3 class="voice-name"><a href="{v["linkedin_url"]}" target="_blank" rel="noopener">{v["name"]}</a></h3>
-      <p class="voice-title">{v["title"]} at {v["company"]}</p>
+      <h3 class="voice-name"><a href="/voices/{slug}/">{name}</a></h3>
+      <p class="voice-title">{title} at {company}</p>
       <div class="voice-tags">{tags}</div>
     </div>
-    <a href="{v["linkedin_url"]}" target="_blank" rel="noopener" class="voice-linkedin-btn" aria-label="View {v["name"]} on LinkedIn">
-      <svg width="20" height="20" viewBox="0 0 24 24" fill="currentColor"><path d="M20.447 20.452h-3.554v-5.569c0-1.328-.027-3.037-1.852-3.037-1.853 0-2.136 1.445-2.136 2.939v5.667H9.351V9h3.414v1.561h.046c.477-.9 1.637-1.85 3.37-1.85 3.601 0 4.267 2.37 4.267 5.455v6.286zM5.337 7.433a2.062 2.062 0 01-2.063-2.065 2.064 2.064 0 112.063 2.065zm1.782 13.019H3.555V9h3.564v11.452zM22.225 0H1.771C.792 0 0 .774 0 1.729v20.542C0 23.227.792 24 1.771 24h20.451C23.2 24 24 23.227 24 22.271V1.729C24 .774 23.2 0 22.222 0h.003z"/></svg>
+    <a href="{linkedin_url}" target="_blank" rel="noopener" class="voice-linkedin-btn" aria-label="View {name} on LinkedIn">
+      ''' + LINKEDIN_ICON.replace('{', '{{').replace('}', '}}') + '''
     </a>
   </div>
-  <p class="voice-bio">{v["bio"]}</p>
+  <p class="voice-bio">{bio}</p>
 </div>'''
+TOP_RANKS = 3  # ranks with the highlighted badge
 
-def generate():
-    data = load_voices()
-    voices = data["voices"]
-    leaders = [v for v in voices if v.get("tier") == "leader"]
-    rising = [v for v in voices if v.get("tier") == "rising"]
-    last_updated = data.get("last_updated", "2026-04-14")
-
-    leaders_html = ''.join(voice_card(v) for v in leaders)
-    rising_html = ''.join(voice_card(v) for v in rising)
-    jump_links = ''.join(f'<a href="#voice-{v["rank"]}" class="voice-jump-link">#{v["rank"]} {v["name"].split()[0]}</a>' for v in voices)
-
-    list_items = ','.join(f'{{"@type":"ListItem","position":{v["rank"]},"item":{{"@type":"Person","name":"{v["name"]}","jobTitle":"{v["title"]}","url":"{v["linkedin_url"]}"}}}}' for v in voices)
-
-    html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <meta name="robots" content="index, follow">
-  <script async src="https://www.googletagmanager.com/gtag/js?id=G-WMWEZTSWM0"></script>
-  <script>window.dataLayer=window.dataLayer||[];function gtag(){{dataLayer.push(arguments)}}gtag('js',new Date());gtag('config','G-WMWEZTSWM0');</script>
-  <meta name="description" content="Data-driven rankings of the 25 most influential prompt engineers, AI engineers, and educators shaping how professionals work with AI systems.">
-  <title>Top 25 Prompt Engineering Voices 2026 — PE Collective</title>
-  <meta property="og:type" content="website">
-  <meta property="og:url" content="{BASE_URL}/voices/">
-  <meta property="og:title" content="Top 25 Prompt Engineering Voices of 2026">
-  <meta property="og:description" content="Rankings of the most influential prompt engineers and AI educators.">
-  <meta property="og:image" content="{BASE_URL}/assets/social-preview.png">
-  <meta property="og:site_name" content="{SITE_NAME}">
-  <link rel="canonical" href="{BASE_URL}/voices/">
-  <meta name="twitter:card" content="summary_large_image">
-  <meta name="twitter:title" content="Top 25 Prompt Engineering Voices of 2026">
-  <meta name="twitter:description" content="Rankings of the most influential prompt engineers and AI educators.">
-  <meta name="twitter:image" content="{BASE_URL}/assets/social-preview.png">
-  <script type="application/ld+json">
-  {{"@context":"https://schema.org","@type":"BreadcrumbList","itemListElement":[{{"@type":"ListItem","position":1,"name":"Home","item":"{BASE_URL}/"}},{{"@type":"ListItem","position":2,"name":"Top Voices","item":"{BASE_URL}/voices/"}}]}}
-  </script>
-  <script type="application/ld+json">
-  {{"@context":"https://schema.org","@type":"ItemList","name":"{data["title"]}","numberOfItems":{len(voices)},"itemListElement":[{list_items}]}}
-  </script>
-  <script type="application/ld+json">
-  {{"@context":"https://schema.org","@type":"Article","headline":"{data["title"]}","author":{{"@type":"Person","name":"Rome Thorndike"}},"publisher":{{"@type":"Organization","name":"{SITE_NAME}"}},"datePublished":"2026-04-14","dateModified":"{last_updated}","url":"{BASE_URL}/voices/"}}
-  </script>
-  <link rel="icon" type="image/jpeg" href="/assets/logo.jpeg">
-  <link rel="preconnect" href="https://fonts.googleapis.com">
-  <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-  <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=DM+Sans:ital,opsz,wght@0,9..40,400;0,9..40,500;0,9..40,600;0,9..40,700&family=Space+Grotesk:wght@400;500;600;700&display=swap" media="print" onload="this.media='all'">
-  <link rel="stylesheet" href="/assets/css/style.css">
-  <style>
-.voices-hero {{ text-align: center; padding: var(--space-4xl) 0 var(--space-2xl); }}
-.voices-hero .eyebrow {{ color: var(--color-gold); font-size: 0.85rem; font-weight: 600; text-transform: uppercase; letter-spacing: 0.08em; margin-bottom: 0.75rem; }}
-.voices-hero h1 {{ font-family: var(--font-display); font-size: clamp(1.75rem, 4vw, 2.5rem); font-weight: 700; margin-bottom: 0.75rem; }}
-.voices-subtitle {{ font-size: 1.1rem; color: var(--color-text-secondary); margin-bottom: 0.5rem; }}
-.voices-meta {{ font-size: 0.85rem; color: var(--color-text-muted); }}
-.voices-content {{ max-width: 800px; margin: 0 auto; padding: 0 1.5rem var(--space-3xl); }}
-.voice-methodology {{ margin-bottom: var(--space-xl); border: 1px solid rgba(255,255,255,0.08); border-radius: var(--radius-lg); background: var(--color-bg-card); }}
-.voice-methodology summary {{ padding: 1rem 1.25rem; cursor: pointer; color: var(--color-text-primary); font-weight: 600; }}
-.voice-methodology summary:hover {{ color: var(--color-gold); }}
-.methodology-content {{ padding: 0 1.25rem 1.25rem; font-size: 0.9rem; color: var(--color-text-secondary); line-height: 1.7; }}
-.methodology-content ul {{ padding-left: 1.25rem; margin: 0.75rem 0; }}
-.methodology-content li {{ margin-bottom: 0.5rem; }}
-.voices-jump-nav {{ display: flex; flex-wrap: wrap; gap: 0.25rem; margin-bottom: var(--space-xl); padding: 0.75rem; background: var(--color-bg-card); border: 1px solid rgba(255,255,255,0.08); border-radius: var(--radius-lg); }}
-.voice-jump-link {{ font-size: 0.75rem; font-family: monospace; padding: 0.25rem 0.5rem; border-radius: 6px; color: var(--color-text-muted); text-decoration: none; transition: background 0.15s, color 0.15s; }}
-.voice-jump-link:hover {{ background: var(--color-gold); color: var(--color-bg-dark); }}
-.voices-section-heading {{ font-family: var(--font-display); font-size: 1.3rem; margin-bottom: 0.5rem; padding-bottom: 0.5rem; border-bottom: 2px solid var(--color-gold); }}
-.voices-grid {{ display: flex; flex-direction: column; gap: 1rem; margin-bottom: var(--space-2xl); }}
-.voice-card {{ border: 1px solid rgba(255,255,255,0.08); border-radius: var(--radius-lg); background: var(--color-bg-card); padding: 1.25rem; transition: border-color 0.25s, box-shadow 0.25s; }}
-.voice-card:hover {{ border-color: var(--color-gold); box-shadow: var(--shadow-glow); }}
-.voice-card-header {{ display: flex; align-items: flex-start; gap: 0.75rem; }}
-.voice-rank, .voice-rank-top {{ font-family: monospace; font-weight: 700; font-size: 1.1rem; min-width: 2.5rem; text-align: center; flex-shrink: 0; color: var(--color-text-muted); }}
-.voice-rank-top {{ color: var(--color-gold-light); font-size: 1.25rem; }}
-.voice-card-info {{ flex: 1; min-width: 0; }}
-.voice-name {{ font-size: 1.1rem; font-weight: 600; margin: 0 0 0.25rem; }}
-.voice-name a {{ color: var(--color-text-primary); text-decoration: none; }}
-.voice-name a:hover {{ color: var(--color-gold-light); }}
-.voice-title {{ font-size: 0.85rem; color: var(--color-text-secondary); margin: 0 0 0.5rem; }}
-.voice-tags {{ display: flex; flex-wrap: wrap; gap: 0.35rem; }}
-.voice-tag {{ font-size: 0.7rem; font-family: monospace; padding: 0.15rem 0.5rem; border-radius: 999px; background: rgba(232,168,124,0.1); color: var(--color-gold); font-weight: 500; }}
-.voice-linkedin-btn {{ flex-shrink: 0; display: flex; align-items: center; justify-content: center; width: 2.25rem; height: 2.25rem; border-radius: 6px; color: var(--color-text-muted); text-decoration: none; }}
-.voice-linkedin-btn:hover {{ color: #0077B5; background: rgba(0,119,181,0.15); }}
-.voice-bio {{ margin: 0.75rem 0 0; font-size: 0.9rem; color: var(--color-text-secondary); line-height: 1.7; padding-left: calc(2.5rem + 0.75rem); }}
-.voices-share-cta {{ text-align: center; padding: var(--space-xl) 1.5rem; max-width: 600px; margin: 0 auto; }}
-.voices-share-cta h2 {{ font-family: var(--font-display); font-size: 1.3rem; margin-bottom: 0.5rem; }}
-.voices-share-cta p {{ color: var(--color-text-secondary); margin-bottom: 0.5rem; }}
-@media (max-width: 640px) {{ .voice-bio {{ padding-left: 0; }} .voice-card-header {{ flex-wrap: wrap; }} .voice-card {{ position: relative; }} .voice-linkedin-btn {{ position: absolute; top: 1rem; right: 1rem; }} .voices-jump-nav {{ display: none; }} }}
-  </style>
-</head>
-<body>
-  <a href="#main" class="skip-link">Skip to main content</a>
-  <header class="header">
-    <div class="container">
-      <div class="header__inner">
-        <a href="/" class="header__logo">
-          <img src="/assets/logo.jpeg" alt="PE Collective Logo" width="36" height="36">
-          <span>PE Collective</span>
-        </a>
-        <nav class="header__nav">
-          <a href="/jobs/">AI Jobs</a>
-          <a href="/salaries/">Salaries</a>
-          <a href="/tools/">Tools</a>
-          <a href="/voices/" class="active">Top Voices</a>
-          <a href="/blog/">Blog</a>
-          <a href="/insights/">Market Intel</a>
-          <a href="/about/">About</a>
-        </nav>
-        <div class="header__cta">
-          <a href="/join/" class="btn btn--secondary btn--small">Join Community</a>
-          <a href="https://ainewsdigest.substack.com" target="_blank" rel="noopener" class="btn btn--primary btn--small">Newsletter</a>
-        </div>
-        <button class="header__menu-btn" aria-label="Open menu">&#9776;</button>
-      </div>
-    </div>
-  </header>
-  <div class="header__mobile-overlay"></div>
-  <nav class="header__mobile-nav" aria-label="Mobile navigation">
-    <div class="header__mobile-nav-top">
-      <span>PE Collective</span>
-      <button class="header__mobile-close" aria-label="Close menu">&#10005;</button>
-    </div>
-    <ul class="header__mobile-links">
-      <li><a href="/jobs/">AI Jobs</a></li>
-      <li><a href="/salaries/">Salaries</a></li>
-      <li><a href="/tools/">Tools</a></li>
-      <li><a href="/voices/">Top Voices</a></li>
-      <li><a href="/blog/">Blog</a></li>
-      <li><a href="/insights/">Market Intel</a></li>
-      <li><a href="/about/">About</a></li>
-    </ul>
-    <a href="/join/" class="header__mobile-cta">Join Community</a>
-  </nav>
-  <script>
-  (function(){{
-    var b=document.querySelector('.header__menu-btn'),c=document.querySelector('.header__mobile-close'),o=document.querySelector('.header__mobile-overlay'),n=document.querySelector('.header__mobile-nav');
-    function open(){{n.classList.add('active');o.classList.add('active');document.body.style.overflow='hidden';}}
-    function close(){{n.classList.remove('active');o.classList.remove('active');document.body.style.overflow='';}}
-    if(b)b.addEventListener('click',open);if(c)c.addEventListener('click',close);if(o)o.addEventListener('click',close);
-    document.querySelectorAll('.header__mobile-links a,.header__mobile-cta').forEach(function(l){{l.addEventListener('click',close);}});
-  }})();
-  </script>
-
-  <main id="main">
+def rank_class(rank):
+    return "voice-rank-top" if rank <= TOP_RANKS else "voice-rank"
+
+def tag_spans(tags):
+    return ''.join(f'<span class="voice-tag">{t}</span>' for t in tags)
+
+def voice_card(v):
+    return CARD_TEMPLATE.format(rank=v.rank, rank_class=rank_class(v.rank), slug=v.slug, name=v.name,
+                                title=v.title, company=v.company, tags=tag_spans(v.tags),
+                                linkedin_url=v.linkedin_url, bio=v.bio)
+
+# CARD_TEMPLATE as (constant text, field that follows it or None) pairs.
+_CARD_PARTS = [(text, field) for text, field, _, _ in string.Formatter().parse(CARD_TEMPLATE)]
+_TOP_RANK_CLASS = {rank: rank_class(rank) for rank in range(1, TOP_RANKS + 1)}
+_RANK_CLASS = rank_class(TOP_RANKS + 1)
+_RANK, _NAME, _TAGS, _SLUG, _TITLE, _COMPANY, _URL, _BIO = map(attrgetter, (
+    'rank', 'name', 'tags', 'slug', 'title', 'company', 'linkedin_url', 'bio'))
+_LIST_ROW = attrgetter('rank', 'name', 'title', 'linkedin_url')  # ItemList rows for structured_data
+
+def _card_batch(voices):
+    """voice_card() for every voice, concatenated. Each field is pulled out as a
+    column with C-level map()s and interleaved with the constant pieces of
+    CARD_TEMPLATE in one join, so there is no per-card Python frame or format()."""
+    n = len(voices)
+    rank_ints = list(map(_RANK, voices))
+    columns = {
+        "rank": list(map(str, rank_ints)),
+        "rank_class": list(map(_TOP_RANK_CLASS.get, rank_ints, repeat(_RANK_CLASS))),
+        "slug": list(map(_SLUG, voices)),
+        "name": list(map(_NAME, voices)),
+        "title": list(map(_TITLE, voices)),
+        "company": list(map(_COMPANY, voices)),
+        "tags": ['<span class="voice-tag">' + '</span><span class="voice-tag">'.join(t) + '</span>' if t else ''
+                 for t in map(_TAGS, voices)],
+        "linkedin_url": list(map(_URL, voices)),
+        "bio": list(map(_BIO, voices)),
+    }
+    parts = []
+    for text, field in _CARD_PARTS:
+        if text:
+            parts.append(repeat(text, n))
+        if field is not None:
+            parts.append(columns[field])
+    return ''.join(chain.from_iterable(zip(*parts)))
+
+def voice_cards(voices, batch=CARD_BATCH):
+    """Yield the cards for `voices` in chunks of `batch`; byte-identical to
+    ''.join(map(voice_card, voices))."""
+    for start in range(0, len(voices), batch):
+        yield _card_batch(voices[start:start + batch])
+
+def _structured_data(data, url):
+    voices = data["index"].voices
+    trail = [("Top Voices", "/voices/")] + ([(data["title"], url)] if url != '/voices/' else [])
+    return structured_data.script_tags(
+        structured_data.breadcrumbs(*trail),
+        structured_data.item_list(data["title"], len(voices), map(_LIST_ROW, voices),
+                                  "Person", "name", "jobTitle", "url"),
+        structured_data.article(data["title"], url, data.get("date_published", data["last_updated"]),
+                                data["last_updated"]))
+
+def _tier_sections(data, index):
+    overrides = {t["id"]: (t.get("heading"), t.get("intro")) for t in data.get("tiers", ())}
+    for tier, voices in index.tiers.items():
+        heading, intro = TIER_COPY.get(tier, (f'{(tier or "ranked").title()} Voices', ""))
+        heading, intro = overrides.get(tier, (heading, intro))
+        heading = heading.format(count=len(voices), first=voices[0].rank, last=voices[-1].rank)
+        yield f'''
+
+      <h2 class="voices-section-heading">{heading}</h2>'''
+        if intro:
+            yield f'''
+      <p style="color: var(--color-text-secondary); margin-bottom: 1rem;">{intro}</p>'''
+        yield '''
+      <div class="voices-grid">'''
+        yield from voice_cards(voices)
+        yield '</div>'
+
+def _main(data):
+    index = data["index"]
+    voices = index.voices
+    yield f'''<main id="main">
     <section class="voices-hero">
       <div class="container">
-        <div class="eyebrow">2026 RANKINGS</div>
+        <div class="eyebrow">{data.get("eyebrow", f'{data["last_updated"][:4]} RANKINGS')}</div>
         <h1>{data["title"]}</h1>
         <p class="voices-subtitle">{data.get("subtitle", "")}</p>
-        <p class="voices-meta">Last updated: {last_updated} &middot; {len(voices)} voices ranked</p>
+        <p class="voices-meta">Last updated: {data["last_updated"]} &middot; {len(voices)} voices ranked</p>
       </div>
     </section>
 
@@ -195,15 +229,12 @@ def generate():
         </div>
       </details>
 
-      <div class="voices-jump-nav">{jump_links}</div>
-
-      <h2 class="voices-section-heading">Top 10 Leaders</h2>
-      <p style="color: var(--color-text-secondary); margin-bottom: 1rem;">The most recognized voices shaping prompt engineering and AI engineering.</p>
-      <div class="voices-grid">{leaders_html}</div>
-
-      <h2 class="voices-section-heading">Rising Voices (11-25)</h2>
-      <p style="color: var(--color-text-secondary); margin-bottom: 1rem;">Educators, builders, and thought leaders gaining momentum.</p>
-      <div class="voices-grid">{rising_html}</div>
+      <div class="voices-jump-nav">'''
+    for v in voices:
+        yield f'<a href="#voice-{v.rank}" class="voice-jump-link">#{v.rank} {v.name.split()[0]}</a>'
+    yield '</div>'
+    yield from _tier_sections(data, index)
+    yield '''
     </div>
 
     <section class="voices-share-cta">
@@ -211,59 +242,252 @@ def generate():
       <p>Share it. Tag us on LinkedIn. We will amplify your post.</p>
       <p>Know someone who should be on next year's list? <a href="mailto:rome@getprovyx.com">Let us know</a>.</p>
     </section>
-  </main>
-
-  <footer class="footer">
-    <div class="container">
-      <div class="footer__grid">
-        <div class="footer__brand">
-          <a href="/" class="footer__logo">
-            <img src="/assets/logo.jpeg" alt="PE Collective" width="32" height="32">
-            <span>PE Collective</span>
+  </main>'''
+
+def iter_render(data, url='/voices/'):
+    """Yield the page in chunks; cards and JSON-LD items are produced one voice at
+    a time, so nothing list-sized is ever joined in memory."""
+    description = data.get("description", data.get("subtitle", ""))
+    return iter_page(
+        active="/voices/",
+        title=data.get("page_title", f'{data["title"]} — {SITE_NAME}'),
+        description=description,
+        url=f"{BASE_URL}{url}",
+        og_title=data["title"],
+        og_description=data.get("og_description", description),
+        structured_data=_structured_data(data, url),
+        styles=VOICES_STYLE,
+        icons=ICON_SPRITE,
+        main=_main(data),
+    )
+
+def render(data, url='/voices/'):
+    return ''.join(iter_render(data, url))
+
+def _archive_main(lists):
+    yield '''<main id="main">
+    <section class="voices-hero">
+      <div class="container">
+        <div class="eyebrow">ARCHIVE</div>
+        <h1>Top Voices Lists</h1>
+        <p class="voices-subtitle">Every PE Collective ranking of the people shaping prompt engineering and AI engineering.</p>
+      </div>
+    </section>
+
+    <div class="voices-content">
+      <div class="voices-grid">'''
+    for url, data in lists:
+        yield f'''<div class="voice-card">
+  <h3 class="voice-name"><a href="{url}">{data["title"]}</a></h3>
+  <p class="voice-title">Last updated: {data["last_updated"]} &middot; {len(data["voices"])} voices ranked</p>
+  <p class="voice-bio">{data.get("subtitle", "")}</p>
+</div>'''
+    yield '''</div>
+    </div>
+  </main>'''
+
+def iter_render_archive(lists):
+    """`lists` is [(url, data)], newest first."""
+    return iter_page(
+        active="/voices/",
+        title=f"Top Voices Lists Archive — {SITE_NAME}",
+        description="Every PE Collective Top Voices ranking: yearly lists and niche lists for prompt engineering and AI engineering.",
+        url=f"{BASE_URL}{ARCHIVE_URL}",
+        og_title="Top Voices Lists Archive",
+        og_description="Every PE Collective ranking of prompt engineering and AI engineering voices.",
+        structured_data=structured_data.script_tags(
+            structured_data.breadcrumbs(("Top Voices", "/voices/"), ("Archive", ARCHIVE_URL))),
+        styles=FLAT_STYLE,
+        main=_archive_main(lists),
+    )
+
+def collect_profiles(loaded):
+    """Merge voices across lists by slug. `loaded` is [(url, data)] in list order;
+    each voice keeps its record from the first list it appears on and every
+    (url, list title, rank) appearance. Returns {slug: (voice, appearances)}."""
+    reserved = {url.strip('/').split('/')[-1] for url, _ in loaded} | {ARCHIVE_URL.strip('/').split('/')[-1]}
+    profiles = {}
+    for url, data in loaded:
+        for v in data["voices"]:
+            if not voices_data.SLUG_RE.fullmatch(v.slug):
+                raise ValueError(f'voice {v.name!r}: slug {v.slug!r} is not a single URL path segment')
+            if v.slug in reserved:
+                raise ValueError(f'voice {v.name!r}: slug {v.slug!r} collides with a list URL; set "slug" explicitly')
+            voice, appearances = profiles.get(v.slug, (v, ()))
+            profiles[v.slug] = (voice, appearances + ((url, data["title"], v.rank),))
+    return profiles
+
+def profile_key(profile, sources_key):
+    voice, appearances = profile
+    payload = [getattr(voice, f) for f in voice.__slots__] + [appearances, sources_key]
+    return hashlib.sha256(json.dumps(payload, separators=(',', ':')).encode()).hexdigest()
+
+def _profile_main(voice, appearances):
+    tags = tag_spans(voice.tags)
+    best_url, best_title, best_rank = appearances[0]
+    rankings = '\n'.join(
+        f'            <li><a href="{url}#voice-{rank}">#{rank} on {title}</a></li>'
+        for url, title, rank in appearances)
+    return f'''<main id="main">
+    <section class="voices-hero">
+      <div class="container">
+        <div class="eyebrow">#{best_rank} &middot; {best_title}</div>
+        <h1>{voice.name}</h1>
+        <p class="voices-subtitle">{voice.title} at {voice.company}</p>
+      </div>
+    </section>
+
+    <div class="voices-content">
+      <div class="voice-card">
+        <div class="voice-card-header">
+          <div class="voice-card-info">
+            <div class="voice-tags">{tags}</div>
+          </div>
+          <a href="{voice.linkedin_url}" target="_blank" rel="noopener" class="voice-linkedin-btn" aria-label="View {voice.name} on LinkedIn">
+            {LINKEDIN_ICON}
           </a>
-          <p class="footer__tagline">The job board and community built by AI professionals, for AI professionals.</p>
-        </div>
-        <div class="footer__column">
-          <h4>Jobs</h4>
-          <nav class="footer__links">
-            <a href="/jobs/">All Jobs</a>
-            <a href="/jobs/?category=prompt-engineer">Prompt Engineer</a>
-            <a href="/jobs/?category=ai-engineer">AI Engineer</a>
-            <a href="/jobs/?remote=true">Remote Only</a>
-          </nav>
-        </div>
-        <div class="footer__column">
-          <h4>Tools</h4>
-          <nav class="footer__links">
-            <a href="/tools/">All Tools</a>
-            <a href="/voices/">Top Voices</a>
-            <a href="/glossary/">Glossary</a>
-          </nav>
-        </div>
-        <div class="footer__column">
-          <h4>Community</h4>
-          <nav class="footer__links">
-            <a href="/join/">Join Us</a>
-            <a href="/about/">About</a>
-            <a href="https://ainewsdigest.substack.com" target="_blank" rel="noopener">Newsletter</a>
-          </nav>
         </div>
+        <p class="voice-bio">{voice.bio}</p>
       </div>
-      <div class="footer__bottom">
-        <span>&copy; 2026 PE Collective. All rights reserved.</span>
-        <span>Part of the <a href="https://ainewsdigest.substack.com" target="_blank" rel="noopener">AI News Digest</a> network.</span>
+
+      <h2 class="voices-section-heading">Rankings</h2>
+      <div class="methodology-content">
+        <ul>
+{rankings}
+        </ul>
       </div>
     </div>
-  </footer>
-</body>
-</html>'''
+  </main>'''
+
+def iter_render_profile(voice, appearances):
+    url = f"/voices/{voice.slug}/"
+    person = structured_data.thing(
+        "Person", name=voice.name, jobTitle=voice.title, worksFor={"@type": "Organization", "name": voice.company},
+        description=voice.bio, sameAs=[voice.linkedin_url], url=f"{BASE_URL}{url}")
+    breadcrumbs = structured_data.breadcrumbs(("Top Voices", "/voices/"), (voice.name, url))
+    best_url, best_title, best_rank = appearances[0]
+    return iter_page(
+        active="/voices/",
+        title=f"{voice.name} — #{best_rank} {best_title} — {SITE_NAME}",
+        description=f"{voice.name}, {voice.title} at {voice.company}. Ranked #{best_rank} on {best_title}.",
+        url=f"{BASE_URL}{url}",
+        og_type="profile",
+        og_title=f"{voice.name} — {best_title}",
+        og_description=f"{voice.title} at {voice.company}. Ranked #{best_rank}.",
+        structured_data=structured_data.script_tags(breadcrumbs, person),
+        styles=FLAT_STYLE,
+        icons=ICON_SPRITE,
+        main=_profile_main(voice, appearances),
+    )
+
+def render_profiles(batch):
+    """Render a batch of (voice, appearances) profiles (runs in a pool worker).
+    Returns {output path: digest} and this call's site_output.stats delta."""
+    before = dict(site_output.stats)
+    digests = {}
+    for voice, appearances in batch:
+        out = output_path(f"/voices/{voice.slug}/")
+        digests[out] = write_page(out, iter_render_profile(voice, appearances))
+    return digests, {k: site_output.stats[k] - before[k] for k in before}
+
+def remove_page(path):
+    """Delete a page and its directory, if that leaves the directory empty."""
+    try:
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+    except OSError:  # already gone, or the directory holds other files
+        pass
+
+def generate_profiles(loaded, sources, force=False, jobs=None):
+    profiles = collect_profiles(loaded)
+    sources_key = hashlib.sha256(json.dumps(sources, sort_keys=True).encode()).hexdigest()
+    with phase("check"):
+        keys = {slug: profile_key(p, sources_key) for slug, p in profiles.items()}
+        items = {slug: (keys[slug], output_path(f"/voices/{slug}/")) for slug in profiles}
+        dirty, previous = dirty_items('voices-profiles', items)
+        gone = sorted(set(previous) - {os.path.relpath(path) for _, path in items.values()})
+    for path in gone:  # voices no longer on any list
+        remove_page(path)
+    if force:
+        dirty = list(profiles)
+    outputs = {os.path.relpath(path): previous[os.path.relpath(path)]
+               for slug, (_, path) in items.items() if slug not in dirty}
+    batches = [[profiles[slug] for slug in dirty[i:i + PROFILE_BATCH]]
+               for i in range(0, len(dirty), PROFILE_BATCH)]
+    if len(dirty) >= PROFILE_POOL_MIN and jobs != 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with phase("render"), ProcessPoolExecutor(max_workers=jobs, initializer=compile_shell, initargs=("/voices/",)) as pool:
+            for digests, delta in pool.map(render_profiles, batches):
+                outputs.update(digests)
+                site_output.add_stats(delta)
+    else:
+        for batch in batches:
+            outputs.update(render_profiles(batch)[0])
+    record('voices-profiles', keys, outputs)
+    print(f"Generated: {len(dirty)} voice profiles ({len(profiles) - len(dirty)} unchanged"
+          f"{f', {len(gone)} removed' if gone else ''})")
+
+def render_list(path, url, inputs):
+    """Render one list page (runs in a pool worker). Returns the voice count and
+    this call's site_output.stats delta for the parent to merge."""
+    before = dict(site_output.stats)
+    data = load_voices(path)
+    out = output_path(url)
+    record(manifest_name(url), inputs, {out: write_page(out, iter_render(data, url))})
+    return len(data["voices"]), {k: site_output.stats[k] - before[k] for k in before}
+
+def remove_lists(lists):
+    """Delete the pages (and manifests) of list files that no longer exist."""
+    current = {manifest_name(url) for _, url in lists} | {'voices-archive', 'voices-profiles'}
+    for name in entry_names('voices-'):
+        if name in current:
+            continue
+        for out in (load_entry(name) or {}).get("outputs", {}):
+            remove_page(out)
+        forget(name)
+        print(f"Removed: /voices/{name[len('voices-'):]}/ (list file deleted)")
+
+def generate(force=False, jobs=None):
+    with phase("check"):
+        lists = discover_lists()
+        remove_lists(lists)
+        sources = input_hashes(SOURCES)
+        dirty = []
+        for path, url in lists:
+            inputs = {**sources, **input_hashes([path])}
+            if force or not is_fresh(manifest_name(url), inputs):
+                dirty.append((path, url, inputs))
+            else:
+                print(f"Skipped: {url} (unchanged)")
+
+    compile_shell("/voices/")
+    if len(dirty) > 1 and jobs != 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with phase("render"), ProcessPoolExecutor(max_workers=jobs, initializer=compile_shell, initargs=("/voices/",)) as pool:
+            results = list(pool.map(render_list, *zip(*dirty)))
+        for _, delta in results:
+            site_output.add_stats(delta)
+    else:
+        results = [render_list(*args) for args in dirty]
+    for (path, url, _), (count, _) in zip(dirty, results):
+        print(f"Generated: {url} ({count} voices)")
+
+    loaded = [(url, load_voices(path)) for path, url in lists]
+    with phase("check"):
+        inputs = {**sources, **input_hashes([path for path, _ in lists])}
+        archive_fresh = not force and is_fresh('voices-archive', inputs)
+    if not archive_fresh:
+        newest = sorted(loaded, key=lambda item: item[1]["last_updated"], reverse=True)
+        out = output_path(ARCHIVE_URL)
+        record('voices-archive', inputs, {out: write_page(out, iter_render_archive(newest))})
+        print(f"Generated: {ARCHIVE_URL} ({len(lists)} lists)")
 
-    os.makedirs('site/voices', exist_ok=True)
-    with open('site/voices/index.html', 'w', encoding='utf-8') as f:
-        f.write(html)
-    print(f"Generated: /voices/ ({len(voices)} voices)")
+    generate_profiles(loaded, sources, force, jobs)
+    print(f"Top Voices: {summary()}")
 
 if __name__ == '__main__':
-    print("Generating Top Voices page...")
-    generate()
+    print("Generating Top Voices pages...")
+    cli('top_voices', "Generate the Top Voices pages.", generate,
+        force_help="regenerate even if inputs and output are unchanged",
+        jobs_help="worker processes for rendering lists (default: CPU count)", pages=site_output.stats)
     print("Done!")
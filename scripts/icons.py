@@ -0,0 +1,22 @@
+"""Icon registry shared by the PE Collective generators.
+Each icon's path data is defined once here. A page inlines one hidden sprite with
+a <symbol id="i-<name>"> per icon it uses (pass sprite(...) as the shell's
+{{icons}} slot) and every occurrence is a short <svg><use href="#i-<name>"/>,
+instead of repeating the full path in every card."""
+
+# name -> (viewBox, path data)
+ICONS = {
+    "linkedin": ("0 0 24 24", "M20.447 20.452h-3.554v-5.569c0-1.328-.027-3.037-1.852-3.037-1.853 0-2.136 1.445-2.136 2.939v5.667H9.351V9h3.414v1.561h.046c.477-.9 1.637-1.85 3.37-1.85 3.601 0 4.267 2.37 4.267 5.455v6.286zM5.337 7.433a2.062 2.062 0 01-2.063-2.065 2.064 2.064 0 112.063 2.065zm1.782 13.019H3.555V9h3.564v11.452zM22.225 0H1.771C.792 0 0 .774 0 1.729v20.542C0 23.227.792 24 1.771 24h20.451C23.2 24 24 23.227 24 22.271V1.729C24 .774 23.2 0 22.222 0h.003z"),
+}
+
+def sprite(*names):
+    """Hidden inline <svg> defining a <symbol> for each named icon."""
+    symbols = ''.join(f'<symbol id="i-{name}" viewBox="{ICONS[name][0]}"><path d="{ICONS[name][1]}"/></symbol>'
+                      for name in names)
+    return f'\n  <svg xmlns="http://www.w3.org/2000/svg" style="display:none" aria-hidden="true">{symbols}</svg>'
+
+def icon(name, size=20):
+    """Reference to a sprite symbol; the page must include sprite(name)."""
+    if name not in ICONS:
+        raise KeyError(f'unknown icon {name!r}; add it to ICONS in icons.py')
+    return f'<svg width="{size}" height="{size}" fill="currentColor"><use href="#i-{name}"/></svg>'
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Minify the built pages and write precompressed siblings of text assets.
+minify() collapses whitespace (a run with a newline keeps one), drops comments and
+compacts inline CSS and JSON-LD; tags, <pre>, <textarea> and other scripts are left
+byte-for-byte. compress() writes reproducible .gz and, with brotli installed, .br
+files, cached by input hash; build_site runs it after the sitemap."""
+
+import gzip, hashlib, json, os, re
+
+try:
+    import brotli
+except ImportError:  # optional: .br siblings are skipped without it
+    brotli = None
+
+import build_cache, build_manifest, css_rules, site_output, site_pipeline
+from build_manifest import load_entry
+from build_timing import cli, count, phase
+from site_output import summary, write_bytes
+from site_pipeline import BUILD_DIR, run_stage
+
+COMPRESS_STAGE = 'compress'
+COMPRESS_EXTENSIONS = ('.html', '.css', '.js', '.svg', '.xml', '.json', '.txt')
+COMPRESS_MIN_BYTES = 256  # below this, compression saves less than the headers cost
+COMPRESSED_DIR = 'compressed'  # in the build cache: <format>/<sha256 of the input>
+SOURCES = [__file__, build_cache.__file__, css_rules.__file__, build_manifest.__file__, site_output.__file__,
+           site_pipeline.__file__]
+
+# Comments, raw-text elements (contents handled separately) and tags (attribute
+# values may contain '>' inside quotes); everything between matches is text.
+TOKEN_RE = re.compile(r'''<!--.*?-->|<(script|style|pre|textarea)\b[^>]*>.*?</\1\s*>|<[a-zA-Z/!](?:[^>"']|"[^"]*"|'[^']*')*>''', re.S | re.I)
+SPACE_RE = re.compile(r'\s+')
+RAW_RE = re.compile(r'(<[^>]*>)(.*)(</[^>]*>)', re.S)
+
+def _squeeze(text):
+    return SPACE_RE.sub(lambda m: '\n' if '\n' in m.group() else ' ', text)
+
+def _raw_element(tag, element):
+    tag = tag.lower()
+    if tag in ('pre', 'textarea'):
+        return element
+    open_tag, body, close_tag = RAW_RE.match(element).groups()
+    if tag == 'style':
+        return f'{open_tag}{css_rules.minify(body)}{close_tag}'
+    if 'application/ld+json' in open_tag:
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return element
+        body = json.dumps(data, separators=(',', ':'), ensure_ascii=False).replace('</', '<\\/')
+        return f'{open_tag}{body}{close_tag}'
+    return element
+
+def minify_html(html):
+    # Text on both sides of a dropped comment is squeezed as one run, so a second
+    # pass finds nothing left to do.
+    out, text, pos = [], [], 0
+    for m in TOKEN_RE.finditer(html):
+        text.append(html[pos:m.start()])
+        pos = m.end()
+        token = m.group()
+        if token.startswith('<!--') and not token.startswith('<!--[if'):
+            continue
+        out.append(_squeeze(''.join(text)))
+        text = []
+        out.append(_raw_element(m.group(1), token) if m.group(1) else token)
+    text.append(html[pos:])
+    out.append(_squeeze(''.join(text)))
+    return ''.join(out)
+
+def minify_page(page, html):
+    """Pipeline stage: the minified page and its size before and after, in bytes."""
+    new_html = minify_html(html)
+    return new_html, [len(html.encode('utf-8')), len(new_html.encode('utf-8'))]
+
+def _gzip(data):
+    return gzip.compress(data, 9, mtime=0)
+
+def _brotli(data):
+    return brotli.compress(data, quality=11)
+
+# Cache subdirectory per format; a change of level or quality must change its name.
+COMPRESSORS = (('.gz', 'gzip-9', _gzip), ('.br', 'brotli-11', _brotli if brotli else None))
+
+def compressed(kind, digest, compress, data):
+    """`compress(data)`, from the build cache when `data` was compressed before."""
+    name = f'{COMPRESSED_DIR}/{kind}/{digest}'
+    cached = build_cache.load(name)
+    if cached is None:
+        cached = compress(data)
+        build_cache.store(name, cached)
+    return cached
+
+def compress_file(path, data):
+    """Pipeline stage: write .gz/.br siblings of `path` where they come out smaller
+    (removing stale ones otherwise). Returns [size, gz size, br size]."""
+    sizes, digest = [len(data)], hashlib.sha256(data).hexdigest()
+    for ext, kind, compress in COMPRESSORS:
+        out = compressed(kind, digest, compress, data) if compress else None
+        if out is not None and len(out) < len(data):
+            write_bytes(path + ext, out)
+            sizes.append(len(out))
+        else:
+            if os.path.exists(path + ext):
+                os.remove(path + ext)
+            sizes.append(None)
+    return None, sizes
+
+def minify(force=False, jobs=None):
+    results, processed, rewritten = run_stage('minify', minify_page, SOURCES, force=force, jobs=jobs,
+                                              upstream=['prune-scan', 'critical-css'])
+    before = sum(results[os.path.relpath(p)][0] for p in processed)
+    after = sum(results[os.path.relpath(p)][1] for p in processed)
+    count('html_bytes_saved', before - after)
+    print(f"Minified HTML: {len(rewritten)} pages rewritten, {len(results) - len(processed)} unchanged; "
+          f"{before - after:,} bytes saved ({(after - before) / before if before else 0:+.0%}); {summary()}")
+
+def text_assets(root=BUILD_DIR):
+    paths = []
+    for directory, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+        for name in sorted(files):
+            path = os.path.join(directory, name)
+            if name.endswith(COMPRESS_EXTENSIONS) and os.path.getsize(path) >= COMPRESS_MIN_BYTES:
+                paths.append(path)
+    return paths
+
+def remove_stale_siblings(paths):
+    """Drop .gz/.br siblings of files compressed last run that are gone or now
+    below COMPRESS_MIN_BYTES. Other .gz files (gzipped sitemaps) are left alone."""
+    previous = (load_entry(f'post-{COMPRESS_STAGE}') or {}).get("outputs", {})
+    for path in set(previous) - {os.path.relpath(p) for p in paths}:
+        for ext in ('.gz', '.br'):
+            if os.path.exists(path + ext):
+                os.remove(path + ext)
+
+def prune_compressed():
+    """Drop cached compressed outputs whose input is no longer in the built site."""
+    live = set((load_entry(f'post-{COMPRESS_STAGE}') or {}).get("outputs", {}).values())
+    for _, kind, _ in COMPRESSORS:
+        directory = os.path.join(build_cache.CACHE_DIR, COMPRESSED_DIR, kind)
+        for name in os.listdir(directory) if os.path.isdir(directory) else ():
+            if name not in live:
+                os.remove(os.path.join(directory, name))
+
+def _missing_siblings(path):
+    return not os.path.exists(path + '.gz') or (brotli is not None and not os.path.exists(path + '.br'))
+
+def compress(force=False, jobs=None):
+    with phase("scan"):
+        paths = text_assets()
+        remove_stale_siblings(paths)
+    results, processed, _ = run_stage(COMPRESS_STAGE, compress_file, SOURCES, brotli is not None, paths=paths,
+                                      force=force, jobs=jobs, binary=True, stale=_missing_siblings)
+    prune_compressed()
+    totals = [0, 0, 0]
+    for path in processed:
+        size, gz, br = results[os.path.relpath(path)]
+        totals[0] += size
+        totals[1] += gz or size
+        totals[2] += br or size
+    br_note = f", .br {totals[2]:,}" if brotli else " (.br skipped: brotli not installed)"
+    print(f"Precompressed: {len(processed)} files, {len(paths) - len(processed)} unchanged; "
+          f"{totals[0]:,} bytes -> .gz {totals[1]:,}{br_note}; {summary()}")
+
+if __name__ == '__main__':
+    cli('minify_site', "Minify the built HTML and write .gz/.br siblings.", minify, compress,
+        force_help="reprocess every file, not only changed ones", pages=site_output.stats)
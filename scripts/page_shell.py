@@ -0,0 +1,210 @@
+"""Shared page shell for PE Collective generators.
+The head/meta block, header, mobile nav and footer are identical on every page, so
+they are parsed once into literal chunks plus named {{slots}} and cached per active
+nav section. Rendering a page only fills the slots and joins the list, or streams
+the chunks (iter_page) so large pages never exist as one string."""
+
+import re
+from functools import lru_cache
+
+BASE_URL = "https://pecollective.com"
+SITE_NAME = "PE Collective"
+
+NAV_LINKS = [
+    ("/jobs/", "AI Jobs"),
+    ("/salaries/", "Salaries"),
+    ("/tools/", "Tools"),
+    ("/voices/", "Top Voices"),
+    ("/blog/", "Blog"),
+    ("/insights/", "Market Intel"),
+    ("/about/", "About"),
+]
+
+SLOT_DEFAULTS = {
+    "og_type": "website",
+    "og_image": f"{BASE_URL}/assets/social-preview.png",
+    "structured_data": "",
+    "styles": "",
+    "icons": "",
+}
+
+SHELL = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <meta name="robots" content="index, follow">
+  <script async src="https://www.googletagmanager.com/gtag/js?id=G-WMWEZTSWM0"></script>
+  <script>window.dataLayer=window.dataLayer||[];function gtag(){dataLayer.push(arguments)}gtag('js',new Date());gtag('config','G-WMWEZTSWM0');</script>
+  <meta name="description" content="{{description}}">
+  <title>{{title}}</title>
+  <meta property="og:type" content="{{og_type}}">
+  <meta property="og:url" content="{{url}}">
+  <meta property="og:title" content="{{og_title}}">
+  <meta property="og:description" content="{{og_description}}">
+  <meta property="og:image" content="{{og_image}}">
+  <meta property="og:site_name" content="''' + SITE_NAME + '''">
+  <link rel="canonical" href="{{url}}">
+  <meta name="twitter:card" content="summary_large_image">
+  <meta name="twitter:title" content="{{og_title}}">
+  <meta name="twitter:description" content="{{og_description}}">
+  <meta name="twitter:image" content="{{og_image}}">{{structured_data}}
+  <link rel="icon" type="image/jpeg" href="/assets/logo.jpeg">
+  <link rel="preconnect" href="https://fonts.googleapis.com">
+  <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+  <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=DM+Sans:ital,opsz,wght@0,9..40,400;0,9..40,500;0,9..40,600;0,9..40,700&family=Space+Grotesk:wght@400;500;600;700&display=swap" media="print" onload="this.media='all'">
+  <link rel="stylesheet" href="/assets/css/style.css">{{styles}}
+</head>
+<body>{{icons}}
+  <a href="#main" class="skip-link">Skip to main content</a>
+  <header class="header">
+    <div class="container">
+      <div class="header__inner">
+        <a href="/" class="header__logo">
+          <img src="/assets/logo.jpeg" alt="PE Collective Logo" width="36" height="36">
+          <span>PE Collective</span>
+        </a>
+        <nav class="header__nav">
+{{!header_nav}}
+        </nav>
+        <div class="header__cta">
+          <a href="/join/" class="btn btn--secondary btn--small">Join Community</a>
+          <a href="https://ainewsdigest.substack.com" target="_blank" rel="noopener" class="btn btn--primary btn--small">Newsletter</a>
+        </div>
+        <button class="header__menu-btn" aria-label="Open menu">&#9776;</button>
+      </div>
+    </div>
+  </header>
+  <div class="header__mobile-overlay"></div>
+  <nav class="header__mobile-nav" aria-label="Mobile navigation">
+    <div class="header__mobile-nav-top">
+      <span>PE Collective</span>
+      <button class="header__mobile-close" aria-label="Close menu">&#10005;</button>
+    </div>
+    <ul class="header__mobile-links">
+{{!mobile_nav}}
+    </ul>
+    <a href="/join/" class="header__mobile-cta">Join Community</a>
+  </nav>
+  <script>
+  (function(){
+    var b=document.querySelector('.header__menu-btn'),c=document.querySelector('.header__mobile-close'),o=document.querySelector('.header__mobile-overlay'),n=document.querySelector('.header__mobile-nav');
+    function open(){n.classList.add('active');o.classList.add('active');document.body.style.overflow='hidden';}
+    function close(){n.classList.remove('active');o.classList.remove('active');document.body.style.overflow='';}
+    if(b)b.addEventListener('click',open);if(c)c.addEventListener('click',close);if(o)o.addEventListener('click',close);
+    document.querySelectorAll('.header__mobile-links a,.header__mobile-cta').forEach(function(l){l.addEventListener('click',close);});
+  })();
+  </script>
+
+  {{main}}
+
+  <footer class="footer">
+    <div class="container">
+      <div class="footer__grid">
+        <div class="footer__brand">
+          <a href="/" class="footer__logo">
+            <img src="/assets/logo.jpeg" alt="PE Collective" width="32" height="32">
+            <span>PE Collective</span>
+          </a>
+          <p class="footer__tagline">The job board and community built by AI professionals, for AI professionals.</p>
+        </div>
+        <div class="footer__column">
+          <h4>Jobs</h4>
+          <nav class="footer__links">
+            <a href="/jobs/">All Jobs</a>
+            <a href="/jobs/?category=prompt-engineer">Prompt Engineer</a>
+            <a href="/jobs/?category=ai-engineer">AI Engineer</a>
+            <a href="/jobs/?remote=true">Remote Only</a>
+          </nav>
+        </div>
+        <div class="footer__column">
+          <h4>Tools</h4>
+          <nav class="footer__links">
+            <a href="/tools/">All Tools</a>
+            <a href="/voices/">Top Voices</a>
+            <a href="/glossary/">Glossary</a>
+          </nav>
+        </div>
+        <div class="footer__column">
+          <h4>Community</h4>
+          <nav class="footer__links">
+            <a href="/join/">Join Us</a>
+            <a href="/about/">About</a>
+            <a href="https://ainewsdigest.substack.com" target="_blank" rel="noopener">Newsletter</a>
+          </nav>
+        </div>
+      </div>
+      <div class="footer__bottom">
+        <span>&copy; 2026 PE Collective. All rights reserved.</span>
+        <span>Part of the <a href="https://ainewsdigest.substack.com" target="_blank" rel="noopener">AI News Digest</a> network.</span>
+      </div>
+    </div>
+  </footer>
+</body>
+</html>'''
+
+# {{name}} is a per-page slot; {{!name}} is filled once at compile time.
+SLOT_RE = re.compile(r'\{\{(!?\w+)\}\}')
+
+class CompiledShell:
+    """Literal chunks with the per-page slot positions recorded once."""
+    __slots__ = ('parts', 'slots')
+
+    def __init__(self, parts, slots):
+        self.parts = parts
+        self.slots = slots
+
+    def render(self, **values):
+        parts = self.parts[:]
+        for i, name in self.slots:
+            parts[i] = values[name] if name in values else SLOT_DEFAULTS[name]
+        return ''.join(parts)
+
+    def iter_render(self, **values):
+        """Yield the page chunk by chunk for f.writelines(); slot values may be
+        strings or iterables of strings, which are streamed without joining."""
+        slots = dict(self.slots)
+        for i, part in enumerate(self.parts):
+            if i not in slots:
+                yield part
+                continue
+            name = slots[i]
+            value = values[name] if name in values else SLOT_DEFAULTS[name]
+            if isinstance(value, str):
+                yield value
+            else:
+                yield from value
+
+def _nav_html(active):
+    header = '\n'.join(
+        f'          <a href="{href}" class="active">{label}</a>' if href == active
+        else f'          <a href="{href}">{label}</a>'
+        for href, label in NAV_LINKS)
+    mobile = '\n'.join(f'      <li><a href="{href}">{label}</a></li>' for href, label in NAV_LINKS)
+    return {"!header_nav": header, "!mobile_nav": mobile}
+
+@lru_cache(maxsize=None)
+def compile_shell(active=None):
+    """Parse SHELL once per active nav section. Adjacent literals are merged so a
+    render joins as few strings as possible."""
+    fixed = _nav_html(active)
+    parts, slots, literal = [], [], False
+    for i, piece in enumerate(SLOT_RE.split(SHELL)):
+        if i % 2 and piece not in fixed:
+            slots.append((len(parts), piece))
+            parts.append('')
+            literal = False
+            continue
+        text = fixed[piece] if i % 2 else piece
+        if literal:
+            parts[-1] += text
+        else:
+            parts.append(text)
+            literal = True
+    return CompiledShell(parts, tuple(slots))
+
+def render_page(active=None, **values):
+    return compile_shell(active).render(**values)
+
+def iter_page(active=None, **values):
+    return compile_shell(active).iter_render(**values)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Prune unused CSS across the built site into minified bundles per template family.
+Pages are grouped by family (home, section index, section detail) and their leading
+run of local stylesheet links. Each group's sheets are pruned to the rules its pages
+and their scripts' strings can match, and linked as one bundle-<group>-<hash>.css;
+.build-cache/css-bundles.json maps bundles back to their sources for re-bundling."""
+
+import hashlib, json, os, re
+
+import build_manifest, css_rules, site_output, site_pipeline
+from build_manifest import file_hash, input_hashes, load_json
+from build_timing import cli, count, phase
+from critical_css import BLOCKING_RE, restore as restore_critical, stylesheet_path
+from extract_inline_css import CSS_DIR, CSS_URL
+from site_output import summary, write_text
+from site_pipeline import BUILD_DIR, run_stage, site_pages
+
+BUNDLES_JSON = '.build-cache/css-bundles.json'
+CACHE_PATH = '.build-cache/prune-css.json'
+JS_DIR = f'{BUILD_DIR}/assets/js'
+SOURCES = [__file__, css_rules.__file__, build_manifest.__file__, site_output.__file__, site_pipeline.__file__]
+
+BUNDLE_LINK_RE = re.compile(rf'<link rel="stylesheet" href="{CSS_URL}/(bundle-[\w-]+-[0-9a-f]{{8}}\.css)">')
+BUNDLE_FILE_RE = re.compile(r'bundle-[\w-]+-[0-9a-f]{8}\.css$')
+SCRIPT_RE = re.compile(r'<script\b[^>]*>(.*?)</script>', re.S)
+JS_STRING_RE = re.compile(r'''"((?:\\.|[^"\\\n])*)"|'((?:\\.|[^'\\\n])*)\'''')
+WORD_RE = re.compile(r'-?[_a-zA-Z][-\w]*')
+
+def template_family(page):
+    """'home' for top-level pages, the section for section index pages (voices/),
+    '<section>-detail' for pages below it (voices/<slug>/)."""
+    parts = os.path.relpath(page, BUILD_DIR).split(os.sep)
+    if len(parts) == 1:
+        return 'home'
+    return parts[0] if len(parts) == 2 else f'{parts[0]}-detail'
+
+def script_words(js):
+    """Identifier-like words in a script's string literals: anything a script could
+    add as a class or id (classList.add('active'), className = 'x y')."""
+    return {w for a, b in JS_STRING_RE.findall(js) for w in WORD_RE.findall(a or b)}
+
+def restore(html, bundles):
+    """Undo this stage and the critical CSS stage: bundle links become their sources."""
+    def expand(match):
+        sources = bundles.get(match.group(1))
+        if not sources:
+            return match.group(0)
+        return '\n  '.join(f'<link rel="stylesheet" href="{href}">' for href in sources)
+    return BUNDLE_LINK_RE.sub(expand, restore_critical(html))
+
+def leading_links(page, html):
+    """The first run of adjacent local stylesheet links in <head>: (start, end, hrefs)."""
+    head_end = html.find('</head>')
+    run, start, end = [], None, None
+    for m in BLOCKING_RE.finditer(html, 0, max(head_end, 0)):
+        path = stylesheet_path(page, m.group(1))
+        if not path or not os.path.exists(path) or (run and html[end:m.start()].strip()):
+            if run:
+                break
+            continue
+        if not run:
+            start = m.start()
+        run.append('/' + os.path.relpath(path, BUILD_DIR).replace(os.sep, '/'))
+        end = m.end()
+    return (start, end, run) if run else None
+
+def bundled(html):
+    """Name of the bundle a page links, if it has been processed."""
+    m = BUNDLE_LINK_RE.search(html)
+    return m.group(1) if m else None
+
+def page_facts(page, raw, bundles):
+    """Pipeline stage: tokens and leading stylesheets of a page as its generator
+    wrote it, plus the bundle it currently links. Never rewrites the page."""
+    html = restore(raw, bundles)
+    tags, classes, ids = css_rules.page_tokens(html)
+    words = set()
+    for js in SCRIPT_RE.findall(html):
+        words |= script_words(js)
+    links = leading_links(page, html)
+    return None, [{"tags": sorted(tags), "classes": sorted(classes | words), "ids": sorted(ids | words),
+                   "links": links[2] if links else []}, bundled(raw)]
+
+def build_bundle(family, sources, facts, safelist):
+    """Pruned, minified CSS for `sources` against every page in the family."""
+    tags, classes, ids = {'html', 'body'}, set(safelist), set(safelist)
+    for f in facts:
+        tags.update(f["tags"])
+        classes.update(f["classes"])
+        ids.update(f["ids"])
+    matches = css_rules.matcher(tags, classes, ids)
+    parts = []
+    for href in sources:
+        with open(os.path.join(BUILD_DIR, href.lstrip('/')), 'r', encoding='utf-8') as f:
+            parts.append(css_rules.serialize(css_rules.filter_rules(css_rules.parse(f.read()), matches)))
+    return '\n'.join(parts) + '\n'
+
+def run(force=False, jobs=None):
+    pages = site_pages(BUILD_DIR)
+    bundles = load_json(BUNDLES_JSON, {})
+    families_cache = {} if force else load_json(CACHE_PATH, {}).get("families", {})
+    scanned = run_stage('prune-scan', page_facts, SOURCES, sorted(bundles.items()), (bundles,),
+                        pages, force, jobs)[0]
+    facts = {p: scanned[os.path.relpath(p)][0] for p in pages}
+    linked = {p: scanned[os.path.relpath(p)][1] for p in pages}
+    with phase("scan"):
+        safelist = set()
+        for directory, _, files in os.walk(JS_DIR):
+            for name in sorted(files):
+                if name.endswith('.js'):
+                    with open(os.path.join(directory, name), 'r', encoding='utf-8') as f:
+                        safelist |= script_words(f.read())
+        sources_key = sorted(input_hashes(SOURCES).items())
+
+    families = {}
+    for page in pages:
+        if facts[page]["links"]:
+            families.setdefault(template_family(page), {}).setdefault(tuple(facts[page]["links"]), []).append(page)
+    groups = {}
+    for family, by_links in families.items():
+        for i, (sources, members) in enumerate(sorted(by_links.items(), key=lambda item: -len(item[1]))):
+            groups[family if not i else f'{family}-{i + 1}'] = (list(sources), members)
+
+    new_bundles, rewritten, results = {}, {}, {}
+    for family, (sources, members) in sorted(groups.items()):
+        source_hashes = {href: file_hash(os.path.join(BUILD_DIR, href.lstrip('/'))) for href in sources}
+        key = hashlib.sha256(json.dumps([sources_key, source_hashes, sorted(safelist),
+                                         [facts[p] for p in members]], sort_keys=True).encode()).hexdigest()
+        previous = families_cache.get(family)
+        if previous and previous["key"] == key and all(linked[p] == previous["bundle"] for p in members):
+            results[family] = previous
+            new_bundles[previous["bundle"]] = sources
+            continue
+        with phase("prune"):
+            css = build_bundle(family, sources, [facts[p] for p in members], safelist)
+        name = f'bundle-{family}-{hashlib.md5(css.encode()).hexdigest()[:8]}.css'
+        write_text(os.path.join(CSS_DIR, name), css)
+        new_bundles[name] = sources
+        merged = {**bundles, **new_bundles}
+        for page in members:
+            if linked[page] == name:
+                continue
+            with phase("rewrite"):
+                with open(page, 'r', encoding='utf-8') as f:
+                    restored = restore(f.read(), merged)
+                start, end, _ = leading_links(page, restored)
+                new_html = f'{restored[:start]}<link rel="stylesheet" href="{CSS_URL}/{name}">{restored[end:]}'
+            rewritten[page] = write_text(page, new_html)
+            linked[page] = name
+        before = sum(os.path.getsize(os.path.join(BUILD_DIR, href.lstrip('/'))) for href in sources)
+        results[family] = {"key": key, "bundle": name, "before": before, "after": len(css.encode())}
+
+    for family, r in sorted(results.items()):
+        count(f'css_bytes_saved.{r["bundle"]}', r["before"] - r["after"])
+        print(f'  {r["bundle"]:<40}{r["before"]:>10,} -> {r["after"]:>9,} bytes '
+              f'({(r["after"] - r["before"]) / r["before"]:+.0%})')
+    for name in os.listdir(CSS_DIR):
+        if BUNDLE_FILE_RE.match(name) and name not in new_bundles:
+            os.remove(os.path.join(CSS_DIR, name))
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    write_text(BUNDLES_JSON, json.dumps(new_bundles, indent=2, sort_keys=True) + '\n')
+    with open(CACHE_PATH, 'w') as f:
+        json.dump({"families": results}, f)
+    saved = sum(r["before"] - r["after"] for r in results.values())
+    print(f"Pruned CSS: {len(results)} bundles, {saved:,} bytes saved; "
+          f"{len(rewritten)} pages rewritten; {summary()}")
+
+if __name__ == '__main__':
+    cli('prune_css', "Prune unused CSS into per-template-family bundles.", run,
+        force_help="rescan every page and rebuild every bundle", pages=site_output.stats)
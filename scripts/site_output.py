@@ -0,0 +1,69 @@
+"""Atomic, write-if-changed output shared by the site generators.
+Pages are streamed into a temp file in the target's directory and hashed on the way;
+the temp file only replaces the target (os.replace) when the bytes differ. A crash
+mid-write never leaves a truncated page, and unchanged pages keep their mtime, so
+git, the Pages deploy and the CDN see no churn."""
+
+import hashlib, os, tempfile
+from build_manifest import file_hash
+from build_timing import phase, timed_iter
+
+# Running totals for this process; generators print summary() when done.
+stats = {"written": 0, "skipped": 0, "bytes": 0}
+
+_umask = os.umask(0)
+os.umask(_umask)
+FILE_MODE = 0o666 & ~_umask
+
+def write_page(path, chunks, encoding='utf-8'):
+    """Write an iterable of str chunks (bytes when `encoding` is None) to `path`
+    if the result differs from what is on disk. Returns the sha256 hex digest of
+    the content. Time spent producing the chunks is reported as the "render"
+    phase, the rest as "write"."""
+    with phase("write"):
+        return _write_page(path, timed_iter(chunks, "render"), encoding)
+
+def _write_page(path, chunks, encoding):
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=f'.{os.path.basename(path)}.', suffix='.tmp')
+    h, size = hashlib.sha256(), 0
+    try:
+        with os.fdopen(fd, 'wb', buffering=1 << 16) as f:
+            for chunk in chunks:
+                data = chunk.encode(encoding) if encoding else chunk
+                h.update(data)
+                size += len(data)
+                f.write(data)
+        digest = h.hexdigest()
+        if os.path.exists(path) and os.path.getsize(path) == size and file_hash(path) == digest:
+            os.unlink(tmp)
+            stats["skipped"] += 1
+            return digest
+        os.chmod(tmp, FILE_MODE)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    stats["written"] += 1
+    stats["bytes"] += size
+    return digest
+
+def write_text(path, text, encoding='utf-8'):
+    return write_page(path, (text,), encoding)
+
+def write_bytes(path, data):
+    return write_page(path, (data,), encoding=None)
+
+def reset_stats():
+    for key in stats:
+        stats[key] = 0
+
+def summary():
+    return f'{stats["written"]} written, {stats["skipped"]} unchanged, {stats["bytes"]:,} bytes'
+
+def add_stats(delta):
+    """Merge counts reported back from a pool worker."""
+    for key, value in delta.items():
+        stats[key] += value
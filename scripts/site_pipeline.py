@@ -0,0 +1,154 @@
+"""Parallel per-file post-processing, shared by the post-processing stages.
+The generators write site/, which stays as they left it; the stages build the
+deployed site in BUILD_DIR (_site/, not in git). copy_site() mirrors everything
+but the pages there, the first stage reads the pages from site/ and writes them
+to BUILD_DIR, and the stages after it rework BUILD_DIR in place. The stages are
+extract_inline_css, prune_css (its page scan), critical_css, minify_site and
+generate_sitemap (its page hashes).
+A stage plugs in as a module-level function `process(path, text, *args)` returning
+(new text or None to leave the file alone, result), where result is any JSON value
+the stage wants back; `path` is where the file is written. run_stage() lists the
+files (every HTML page by default), skips those whose content hash and stage key
+match the last run, shards the rest in batches over a ProcessPoolExecutor and
+streams results back as batches finish. Writes go through site_output, so
+identical output is never rewritten. Each stage keeps a manifest (post-<name>)
+with the output hash and result of every file, so a clean file's result is reused
+without reading the file. Runs with fewer than POOL_MIN dirty files stay
+in-process, where the pool costs more than it saves; they never even import
+concurrent.futures."""
+
+import hashlib, os
+
+import site_output
+from build_manifest import dirty_items, input_hashes, load_entry, record, restamp, tracked_hashes
+from build_timing import phase
+from site_output import write_bytes, write_text
+
+SITE_DIR = 'site'
+BUILD_DIR = '_site'
+BATCH = 32
+POOL_MIN = 64
+
+def site_pages(root=SITE_DIR):
+    """Every HTML page under `root`, in a stable order."""
+    pages = []
+    for directory, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.') and d != 'assets')
+        pages.extend(os.path.join(directory, f) for f in sorted(files) if f.endswith('.html'))
+    return pages
+
+def site_files(root=SITE_DIR):
+    """Every file under `root` that site_pages() leaves out: assets, feeds, CNAME..."""
+    pages, files = set(site_pages(root)), []
+    for directory, dirs, names in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+        files.extend(p for p in (os.path.join(directory, n) for n in sorted(names)) if p not in pages)
+    return files
+
+def stage_key(sources, params=()):
+    """Hash of a stage's source files and parameters; a change reprocesses every file."""
+    return hashlib.sha256(repr((sorted(input_hashes(sources).items()), params)).encode()).hexdigest()
+
+def _process_batch(process, paths, args, binary):
+    """Run `process` over one batch of (source, target) pairs (in a pool worker, or
+    inline). Returns [(target, sha256 before, sha256 after, changed, result)] and
+    the site_output stats delta. A target other than its source is always written."""
+    before, out = dict(site_output.stats), []
+    for path, target in paths:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        old, content = hashlib.sha256(raw).hexdigest(), raw if binary else raw.decode('utf-8')
+        new, result = process(target, content, *args)
+        if new is None or new == content:
+            if target == path:
+                out.append((target, old, old, False, result))
+                continue
+            new = content
+        digest = write_bytes(target, new) if binary else write_text(target, new)
+        out.append((target, old, digest, digest != old, result))
+    return out, {k: site_output.stats[k] - before[k] for k in before}
+
+def _map(process, paths, args, binary, jobs):
+    batches = [paths[i:i + BATCH] for i in range(0, len(paths), BATCH)]
+    if len(paths) < POOL_MIN or jobs == 1:
+        for batch in batches:
+            yield from _process_batch(process, batch, args, binary)[0]
+        return
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(_process_batch, process, batch, args, binary) for batch in batches]
+        for future in as_completed(futures):
+            out, delta = future.result()
+            site_output.add_stats(delta)
+            yield from out
+
+def run_stage(name, process, sources, params=(), args=(), paths=None, force=False, jobs=None,
+              binary=False, stale=None, src=BUILD_DIR, dest=BUILD_DIR, upstream=()):
+    """Run `process` over `paths` under `src` (default: site_pages(src)), writing
+    each file to the same place under `dest`, and return (results for every file,
+    the files processed this run, {path: sha256} of those the stage changed), all
+    by their path under `dest`. `sources` and `params` make up the stage key;
+    `args` are passed through to `process` and must pickle. `binary` hands it
+    bytes instead of text. `stale(path)` can mark a clean file dirty anyway, such
+    as one whose side outputs are missing.
+    In place (src == dest) a file is dirty when it changed since this stage last
+    wrote it. `upstream` names the in-place stages that ran on the same files
+    before this one: a file this stage rewrites is moved to its new hash in their
+    manifests too, so the next build does not see it as changed under them. Otherwise it is dirty when its source changed or its copy is gone:
+    later stages rewrite the copy, so its content is not checked. Copies of
+    sources that are gone are deleted."""
+    paths = site_pages(src) if paths is None else paths
+    manifest = f'post-{name}'
+    if src == dest:
+        targets = {p: p for p in paths}
+    else:
+        targets = {p: os.path.join(dest, os.path.relpath(p, src)) for p in paths}
+    source = {t: p for p, t in targets.items()}
+    rel = {t: os.path.relpath(t) for t in source}  # manifest keys; relpath is slow per call
+    with phase("check"):
+        key = stage_key(sources, params)
+        if src == dest:
+            items = {t: (key, t) for t in source}
+        else:
+            hashes = tracked_hashes(f'{manifest}-sources', paths)
+            items = {t: (f'{key}:{hashes[os.path.relpath(p)]}', t) for p, t in targets.items()}
+        dirty, previous = dirty_items(manifest, items, verify=src == dest)
+        cached = (load_entry(manifest) or {}).get("results", {})
+        if force:
+            dirty = list(source)
+        else:
+            flagged = set(dirty)
+            dirty += [t for t in source if t not in flagged
+                      and (rel[t] not in cached or (stale and stale(t)))]
+    clean = set(source) - set(dirty)
+    outputs = {rel[t]: previous[rel[t]] for t in clean}
+    results = {rel[t]: cached[rel[t]] for t in clean}
+    rewritten, moves = {}, {}
+    with phase(name):
+        for path, old, digest, changed, result in _map(process, [(source[t], t) for t in dirty], args, binary, jobs):
+            outputs[rel[path]] = digest
+            results[rel[path]] = result
+            if changed:
+                rewritten[path] = digest
+                moves[rel[path]] = (old, digest)
+    if src == dest and moves:
+        for stage in upstream:
+            restamp(f'post-{stage}', moves)
+    if src != dest:
+        root = os.path.relpath(dest) + os.sep
+        for path in set(previous) - set(outputs):
+            if path.startswith(root) and os.path.exists(path):
+                os.remove(path)
+    record(manifest, {t: d for t, (d, _) in items.items()}, outputs, results)
+    return results, dirty, rewritten
+
+def _copy(path, data):
+    return None, None
+
+def copy_site(force=False, jobs=None):
+    """Mirror the files of site/ that are not pages into BUILD_DIR."""
+    paths = site_files()
+    processed = run_stage('copy', _copy, [__file__], paths=paths, force=force, jobs=jobs, binary=True,
+                          src=SITE_DIR)[1]
+    print(f"Copied site: {len(processed)} files copied, {len(paths) - len(processed)} unchanged; "
+          f"{site_output.summary()}")
@@ -0,0 +1,116 @@
+"""JSON-LD structured data for the site generators, built as Python structures.
+Generators describe schema.org nodes as dicts; this module serializes them compactly
+(separators=(',', ':'), non-ASCII kept as is) and safe to embed in a <script>
+block ('</' is escaped), so a quote in a name or title can no longer break the
+page. Invariant parts are built once: the publisher and author nodes and the
+serialized head of every breadcrumb trail (context, type and the Home crumb).
+Long ItemLists stream in batches of LIST_BATCH items from %-templates made once
+per item shape; a batch only pays for JSON escaping when one of its values
+contains a character that needs it. Shared by the voices, jobs (JobPosting),
+tools (Product/Offer) and glossary (DefinedTerm) generators."""
+
+import json
+from functools import lru_cache
+from itertools import islice
+
+from page_shell import BASE_URL, SITE_NAME
+
+CONTEXT = "https://schema.org"
+LIST_BATCH = 256
+PUBLISHER = {"@type": "Organization", "name": SITE_NAME}
+AUTHOR = {"@type": "Person", "name": "Rome Thorndike"}
+
+_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False, check_circular=False)
+_quote = json.encoder.encode_basestring  # the C encoder's string quoting (ensure_ascii=False)
+_UNSAFE = bytes(range(0x20)) + b'"\\'  # bytes that JSON escapes inside a string
+
+def dumps(obj):
+    """Compact JSON text that can sit inside <script>."""
+    return _ENCODER.encode(obj).replace('</', '<\\/')
+
+def thing(type_, **props):
+    """A top-level schema.org document: dumps() of {@context, @type, **props}."""
+    return dumps({"@context": CONTEXT, "@type": type_, **props})
+
+def script_tags(*documents):
+    """Yield <script type="application/ld+json"> blocks for iter_page's
+    structured_data slot. A document is JSON text or an iterable of JSON chunks
+    (item_list())."""
+    for doc in documents:
+        yield '\n  <script type="application/ld+json">\n  '
+        if isinstance(doc, str):
+            yield doc
+        else:
+            yield from doc
+        yield '\n  </script>'
+
+_BREADCRUMB_HEAD = (f'{{"@context":"{CONTEXT}","@type":"BreadcrumbList","itemListElement":['
+                    + dumps({"@type": "ListItem", "position": 1, "name": "Home", "item": f"{BASE_URL}/"}))
+
+def breadcrumbs(*trail):
+    """BreadcrumbList for Home > trail, with trail as (name, site path) pairs."""
+    crumbs = ''.join(',' + dumps({"@type": "ListItem", "position": i, "name": name, "item": f"{BASE_URL}{path}"})
+                     for i, (name, path) in enumerate(trail, 2))
+    return f'{_BREADCRUMB_HEAD}{crumbs}]}}'
+
+def article(headline, path, date_published, date_modified, author=AUTHOR):
+    return thing("Article", headline=headline, author=author, publisher=PUBLISHER,
+                 datePublished=date_published, dateModified=date_modified, url=f"{BASE_URL}{path}")
+
+def job_posting(title, company, description, date_posted, path, location=None, salary=None, currency="USD"):
+    """`salary` is (min, max) per year, or None."""
+    props = {"title": title, "description": description, "datePosted": date_posted,
+             "hiringOrganization": {"@type": "Organization", "name": company}, "url": f"{BASE_URL}{path}"}
+    if location:
+        props["jobLocation"] = {"@type": "Place", "address": location}
+    if salary:
+        props["baseSalary"] = {"@type": "MonetaryAmount", "currency": currency,
+                               "value": {"@type": "QuantitativeValue", "minValue": salary[0],
+                                         "maxValue": salary[1], "unitText": "YEAR"}}
+    return thing("JobPosting", **props)
+
+def product(name, description, path, price=None, currency="USD", brand=None):
+    props = {"name": name, "description": description, "url": f"{BASE_URL}{path}"}
+    if brand:
+        props["brand"] = {"@type": "Brand", "name": brand}
+    if price is not None:
+        props["offers"] = {"@type": "Offer", "price": price, "priceCurrency": currency}
+    return thing("Product", **props)
+
+def defined_term(name, description, path, term_set_path='/glossary/'):
+    return thing("DefinedTerm", name=name, description=description, url=f"{BASE_URL}{path}",
+                 inDefinedTermSet={"@type": "DefinedTermSet", "name": f"{SITE_NAME} AI Glossary",
+                                   "url": f"{BASE_URL}{term_set_path}"})
+
+@lru_cache(maxsize=None)
+def _item_templates(item_type, fields):
+    """(plain, escaped) %-templates for one ListItem: plain quotes its values
+    itself, escaped expects values already JSON-quoted."""
+    head = f'{{"@type":"ListItem","position":%d,"item":{{"@type":{dumps(item_type).replace("%", "%%")}'
+    names = [dumps(f).replace('%', '%%') for f in fields]
+    return (head + ''.join(f',{n}:"%s"' for n in names) + '}}',
+            head + ''.join(f',{n}:%s' for n in names) + '}}')
+
+def _plain(text):
+    """True when `text` needs no JSON escaping and holds no '</'."""
+    data = text.encode('utf-8', 'surrogatepass')
+    return b'</' not in data and len(data.translate(None, _UNSAFE)) == len(data)
+
+def item_list(name, count, rows, item_type, *fields):
+    """Stream an ItemList document. `rows` yields (position, value, ...) tuples,
+    one string value per name in `fields`; they become the properties of each
+    item's `item_type` node."""
+    plain, escaped = _item_templates(item_type, fields)
+    yield f'{{"@context":"{CONTEXT}","@type":"ItemList","name":{dumps(name)},"numberOfItems":{count:d},"itemListElement":['
+    rows, sep = iter(rows), ''
+    while True:
+        batch = list(islice(rows, LIST_BATCH))
+        if not batch:
+            break
+        if _plain(''.join([value for row in batch for value in row[1:]])):
+            text = ','.join(map(plain.__mod__, batch))
+        else:
+            text = ','.join([escaped % (row[0], *map(_quote, row[1:])) for row in batch]).replace('</', '<\\/')
+        yield sep + text
+        sep = ','
+    yield ']}'
@@ -0,0 +1,193 @@
+"""Typed, validated loading of voices list files (data/top_voices.json).
+Each voice becomes a __slots__ Voice record, validated once at load time. The list
+is indexed once (VoiceIndex: tiers in rank order, lookup by rank/slug) and the
+validated result is pickled under .build-cache/voices/ keyed on the JSON's mtime,
+size and sha256, so repeated builds skip parsing and validation entirely."""
+
+import hashlib, json, os, pickle, re, unicodedata
+
+CACHE_DIR = '.build-cache/voices'
+SCHEMA_VERSION = 4
+
+# field -> (type, required)
+VOICE_FIELDS = {
+    "rank": (int, True),
+    "name": (str, True),
+    "title": (str, True),
+    "company": (str, True),
+    "linkedin_url": (str, True),
+    "bio": (str, True),
+    "tags": (list, False),
+    "tier": (str, False),
+    "sources": (list, False),
+    "list_appearances": (int, False),
+    "slug": (str, False),
+}
+
+class Voice:
+    __slots__ = tuple(VOICE_FIELDS)
+
+    def __init__(self, rank, name, title, company, linkedin_url, bio,
+                 tags=(), tier=None, sources=(), list_appearances=0, slug=None):
+        self.rank = rank
+        self.name = name
+        self.title = title
+        self.company = company
+        self.linkedin_url = linkedin_url
+        self.bio = bio
+        self.tags = tuple(tags)
+        self.tier = tier
+        self.sources = tuple(sources)
+        self.list_appearances = list_appearances
+        self.slug = slug or slugify(name)
+
+    def __reduce__(self):
+        return (Voice, tuple(getattr(self, f) for f in self.__slots__))
+
+    def __repr__(self):
+        return f'Voice(rank={self.rank!r}, name={self.name!r})'
+
+# A slug is one path segment under /voices/; anything else could escape it.
+SLUG_RE = re.compile(r'[a-z0-9]+(?:-[a-z0-9]+)*')
+
+def slugify(text):
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode()
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+class VoiceIndex:
+    """Voices sorted by rank, grouped by tier (tiers ordered by their best rank),
+    with O(1) lookup by rank and slug. Built once per list at load time."""
+    __slots__ = ('voices', 'tiers', 'by_rank', 'by_slug')
+
+    def __init__(self, voices, path='voices'):
+        self.voices = tuple(sorted(voices, key=lambda v: v.rank))
+        self.by_rank, self.by_slug, self.tiers = {}, {}, {}
+        for v in self.voices:
+            if v.rank in self.by_rank:
+                raise ValueError(f'{path}: duplicate rank {v.rank} ({self.by_rank[v.rank].name!r} and {v.name!r})')
+            if v.slug in self.by_slug:
+                raise ValueError(f'{path}: duplicate slug {v.slug!r} ({self.by_slug[v.slug].name!r} and {v.name!r})')
+            self.by_rank[v.rank] = v
+            self.by_slug[v.slug] = v
+            self.tiers.setdefault(v.tier, []).append(v)
+        missing = sorted(set(range(1, len(self.voices) + 1)) - self.by_rank.keys())
+        if missing:
+            raise ValueError(f'{path}: missing rank(s) {missing[:10]}{" ..." if len(missing) > 10 else ""}')
+        self.tiers = {tier: tuple(vs) for tier, vs in self.tiers.items()}
+
+    def tier(self, name):
+        return self.tiers.get(name, ())
+
+    def __reduce__(self):
+        return (VoiceIndex, (self.voices,))
+
+# List-level fields; page copy falls back to title/subtitle when omitted.
+LIST_FIELDS = {
+    "title": (str, True),
+    "subtitle": (str, False),
+    "last_updated": (str, True),
+    "date_published": (str, False),
+    "eyebrow": (str, False),
+    "page_title": (str, False),
+    "description": (str, False),
+    "og_description": (str, False),
+    "methodology": (str, False),
+    "tiers": (list, False),
+    "voices": (list, True),
+}
+
+_CHECKS = tuple((field, kind, required) for field, (kind, required) in VOICE_FIELDS.items())
+_MISSING = object()
+
+def parse_voice(raw, where):
+    """Validate one raw voice dict and build its Voice. `where` is a callable
+    returning the error location, so the happy path never formats it."""
+    if not isinstance(raw, dict):
+        raise ValueError(f'{where()}: expected an object, got {type(raw).__name__}')
+    if not raw.keys() <= VOICE_FIELDS.keys():
+        raise ValueError(f'{where()}: unknown field(s) {sorted(raw.keys() - VOICE_FIELDS.keys())}')
+    for field, kind, required in _CHECKS:
+        value = raw.get(field, _MISSING)
+        if value is _MISSING:
+            if required:
+                raise ValueError(f'{where()}: missing required field "{field}"')
+        elif type(value) is not kind:
+            raise ValueError(f'{where()}: "{field}" must be {kind.__name__}, got {type(value).__name__}')
+        elif kind is list and not all(type(x) is str for x in value):
+            raise ValueError(f'{where()}: "{field}" must be a list of strings')
+    if raw["rank"] < 1:
+        raise ValueError(f'{where()}: "rank" must be >= 1, got {raw["rank"]}')
+    if not raw["name"].strip():
+        raise ValueError(f'{where()}: "name" must not be blank')
+    voice = Voice(**raw)
+    if not SLUG_RE.fullmatch(voice.slug):
+        if raw.get("slug"):
+            raise ValueError(f'{where()}: "slug" must be lowercase letters and digits separated by single '
+                             f'hyphens, got {raw["slug"]!r}')
+        raise ValueError(f'{where()}: no slug can be made from "name" {raw["name"]!r}; set "slug"')
+    return voice
+
+def parse_list(raw, path):
+    if not isinstance(raw, dict):
+        raise ValueError(f'{path}: expected an object, got {type(raw).__name__}')
+    if not raw.keys() <= LIST_FIELDS.keys():
+        raise ValueError(f'{path}: unknown field(s) {sorted(raw.keys() - LIST_FIELDS.keys())}')
+    for field, (kind, required) in LIST_FIELDS.items():
+        if field not in raw:
+            if required:
+                raise ValueError(f'{path}: missing required field "{field}"')
+        elif type(raw[field]) is not kind:
+            raise ValueError(f'{path}: "{field}" must be {kind.__name__}, got {type(raw[field]).__name__}')
+    for i, tier in enumerate(raw.get("tiers", ())):
+        if not isinstance(tier, dict) or not isinstance(tier.get("id"), str) \
+                or not all(isinstance(tier.get(k, ""), str) for k in ("heading", "intro")):
+            raise ValueError(f'{path}: tiers[{i}] must be {{"id": str, "heading": str, "intro": str}}')
+    data = dict(raw)
+    index = VoiceIndex((parse_voice(v, lambda i=i: f'{path}: voices[{i}]') for i, v in enumerate(raw["voices"])), path)
+    data["voices"] = index.voices
+    data["index"] = index
+    return data
+
+def _cache_path(path):
+    key = hashlib.sha256(os.path.abspath(path).encode()).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f'{os.path.splitext(os.path.basename(path))[0]}-{key}.pickle')
+
+def _read_cache(cache_path):
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError, ValueError):
+        return None
+    return cached if isinstance(cached, dict) and cached.get("schema") == SCHEMA_VERSION else None
+
+def _write_cache(cache_path, entry):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp = f'{cache_path}.tmp'
+    with open(tmp, 'wb') as f:
+        pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, cache_path)
+
+def load_list(path, use_cache=True):
+    """Load and validate a voices list file. Returns the list's dict with
+    "voices" replaced by rank-sorted Voice records and "index" holding their
+    VoiceIndex. Raises ValueError on schema errors or bad ranks."""
+    if not use_cache:
+        with open(path, 'rb') as f:
+            return parse_list(json.loads(f.read()), path)
+
+    st = os.stat(path)
+    cache_path = _cache_path(path)
+    cached = _read_cache(cache_path)
+    if cached and cached["mtime_ns"] == st.st_mtime_ns and cached["size"] == st.st_size:
+        return cached["data"]
+
+    with open(path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+    if cached and cached["sha256"] == digest:
+        data = cached["data"]
+    else:
+        data = parse_list(json.loads(raw), path)
+    _write_cache(cache_path, {"schema": SCHEMA_VERSION, "mtime_ns": st.st_mtime_ns,
+                              "size": st.st_size, "sha256": digest, "data": data})
+    return data
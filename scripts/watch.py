@@ -0,0 +1,263 @@
+"""Watch mode for local authoring: `python scripts/build_site.py --watch`.
+Serves site/ on http://127.0.0.1:<port>/ and watches data/ and scripts/. When a
+data file changes, the generator steps whose inputs match it (and the steps after
+them) run in this process, so the incremental manifests skip every page whose
+content hash did not move and a one-voice edit rebuilds in tens of milliseconds.
+A change under scripts/ restarts the process, so edited modules are loaded fresh.
+Changes are picked up with inotify (through ctypes) where the kernel has it, and by
+polling mtimes elsewhere. Every HTML page served gets a small script that listens
+on /__livereload and reloads the page after each rebuild or restart.
+Post-processing (CSS extraction and pruning, critical CSS, minification, sitemap,
+precompression) is left to the next full build; pages are served as generated."""
+
+import ctypes, ctypes.util, fnmatch, functools, os, select, struct, sys, threading, time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from build_site import POST_PROCESSING, STEPS, run_step
+from site_pipeline import SITE_DIR
+
+WATCH_DIRS = ('data', 'scripts')
+DEBOUNCE = 0.03     # seconds without events before a burst of changes is handled
+POLL_INTERVAL = 0.25
+IGNORED = ('*~', '*.swp', '*.swx', '*.tmp', '*.pyc', '.*', '4913')  # editor and temp files
+LIVERELOAD_PATH = '/__livereload'
+LIVERELOAD_SCRIPT = (f'<script>(function(){{var first;new EventSource("{LIVERELOAD_PATH}").onmessage=function(e){{'
+                     'if(first===undefined)first=e.data;else if(e.data!==first)location.reload();}})();</script>')
+
+# inotify(7) event bits
+IN_CLOSE_WRITE, IN_MOVED_FROM, IN_MOVED_TO = 0x8, 0x40, 0x80
+IN_CREATE, IN_DELETE, IN_DELETE_SELF, IN_ISDIR = 0x100, 0x200, 0x400, 0x40000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT = struct.Struct('iIII')
+
+def _ignored(path):
+    parts = path.split('/')
+    return '__pycache__' in parts or any(fnmatch.fnmatch(parts[-1], p) for p in IGNORED)
+
+def _walk_dirs(roots):
+    for root in roots:
+        for directory, dirs, _ in os.walk(root):
+            dirs[:] = sorted(d for d in dirs if not d.startswith('.') and d != '__pycache__')
+            yield directory
+
+def _rel(path):
+    return os.path.relpath(path).replace(os.sep, '/')
+
+def _inotify():
+    """libc with inotify, or None (not Linux, or no libc found)."""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1, libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+def _drain(fd, timeout):
+    """Raw inotify events until `timeout` passes without one (None: wait for the first)."""
+    data = b''
+    while select.select([fd], [], [], timeout)[0]:
+        data += os.read(fd, 1 << 16)
+        timeout = DEBOUNCE
+    return data
+
+def inotify_changes(roots, libc):
+    """Start watching `roots` and return a generator of sets of changed paths, one
+    set per burst of events. Raises OSError, before anything is yielded, when
+    inotify cannot be set up (no instances or watches left)."""
+    fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    if fd < 0:
+        raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+    watches = {}
+    def watch(directory):
+        wd = libc.inotify_add_watch(fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f'inotify_add_watch failed for {directory}')
+        watches[wd] = directory
+    try:
+        for directory in _walk_dirs(roots):
+            watch(directory)
+    except OSError:
+        os.close(fd)
+        raise
+    return _inotify_events(fd, watches, watch)
+
+def _inotify_events(fd, watches, watch):
+    try:
+        while True:
+            data, changed, offset = _drain(fd, None), set(), 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT.unpack_from(data, offset)
+                name = data[offset + EVENT.size:offset + EVENT.size + length].rstrip(b'\0')
+                offset += EVENT.size + length
+                if wd not in watches or not name:
+                    continue
+                path = os.path.join(watches[wd], os.fsdecode(name))
+                if mask & IN_ISDIR:
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        for directory in _walk_dirs([path]):
+                            try:
+                                watch(directory)
+                            except OSError:
+                                pass  # out of watches: changes in this directory go unseen
+                    continue
+                if not _ignored(_rel(path)):
+                    changed.add(_rel(path))
+            if changed:
+                yield changed
+    finally:
+        os.close(fd)
+
+def _snapshot(roots):
+    stamps = {}
+    for directory in _walk_dirs(roots):
+        for entry in os.scandir(directory):
+            if entry.is_file() and not _ignored(_rel(entry.path)):
+                st = entry.stat()
+                stamps[_rel(entry.path)] = (st.st_mtime_ns, st.st_size)
+    return stamps
+
+def polled_changes(roots):
+    """Yield sets of changed paths under `roots` by comparing mtimes and sizes."""
+    before = _snapshot(roots)
+    while True:
+        time.sleep(POLL_INTERVAL)
+        after = _snapshot(roots)
+        changed = {p for p in before.keys() | after.keys() if before.get(p) != after.get(p)}
+        before = after
+        if changed:
+            yield changed
+
+def changes(roots=WATCH_DIRS):
+    libc = _inotify() if sys.platform.startswith('linux') else None
+    if libc is not None:
+        try:
+            return 'inotify', inotify_changes(roots, libc)
+        except OSError:
+            pass
+    return f'polling every {POLL_INTERVAL}s', polled_changes(roots)
+
+def affected_steps(changed):
+    """Generator steps (not post-processing) whose inputs match a changed path,
+    plus every generator step after them, in DAG order."""
+    generators = [s for s in STEPS if s["name"] not in POST_PROCESSING]
+    hit = {s["name"] for s in generators
+           if any(fnmatch.fnmatch(p, pattern) for p in changed for pattern in s["inputs"])}
+    for s in generators:  # STEPS lists every step after its prerequisites
+        if set(s["after"]) & hit:
+            hit.add(s["name"])
+    return [s for s in generators if s["name"] in hit]
+
+# --- livereload ---
+
+_reload = threading.Condition()
+_generation = [f'{time.time_ns():x}', 0]  # process start (changes on restart), rebuild count
+
+def notify_reload():
+    with _reload:
+        _generation[1] += 1
+        _reload.notify_all()
+
+class Handler(SimpleHTTPRequestHandler):
+    """site/ with the livereload script injected into HTML and an event stream
+    at LIVERELOAD_PATH. Nothing is cached by the browser."""
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0].split('#', 1)[0]
+        if path == LIVERELOAD_PATH:
+            return self._events()
+        local = self.translate_path(path)
+        if os.path.isdir(local) and path.endswith('/'):
+            local = os.path.join(local, 'index.html')
+        if local.endswith('.html') and os.path.isfile(local):
+            return self._html(local)
+        return super().do_GET()
+
+    def end_headers(self):
+        self.send_header('Cache-Control', 'no-store')
+        super().end_headers()
+
+    def _html(self, local):
+        with open(local, 'rb') as f:
+            body = f.read()
+        at = body.rfind(b'</body>')
+        script = LIVERELOAD_SCRIPT.encode()
+        body = body[:at] + script + body[at:] if at >= 0 else body + script
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _events(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.end_headers()
+        seen = None
+        try:
+            while True:
+                with _reload:
+                    if _generation[1] == seen:
+                        _reload.wait(15)
+                    current = _generation[1]
+                if current != seen:
+                    self.wfile.write(f'data: {_generation[0]}-{current}\n\n'.encode())
+                    seen = current
+                else:
+                    self.wfile.write(b': keepalive\n\n')
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_request(self, code='-', size='-'):
+        if isinstance(code, int) and code >= 400:
+            super().log_request(code, size)
+
+def serve(port):
+    server = ThreadingHTTPServer(('127.0.0.1', port), functools.partial(Handler, directory=SITE_DIR))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+# --- the loop ---
+
+def rebuild(steps, reason):
+    start = time.perf_counter()
+    ran, failed = [], []
+    for step in steps:
+        status, _, detail, _ = run_step(step["name"], jobs=1)
+        if status != "skipped":
+            ran.append(step["name"])
+        if status == "failed":
+            failed.append(step["name"])
+            print(detail.strip())
+    took = (time.perf_counter() - start) * 1000
+    print(f"[watch] {reason}: {', '.join(ran) or 'nothing to run'} in {took:.0f} ms"
+          f"{' — failed: ' + ', '.join(failed) if failed else ''}")
+    notify_reload()
+
+def _restart(server):
+    print("[watch] scripts changed, restarting")
+    server.shutdown()
+    server.server_close()
+    os.execv(sys.executable, [sys.executable] + sys.argv)
+
+def watch(port=8000):
+    rebuild([s for s in STEPS if s["name"] not in POST_PROCESSING], "startup")
+    server = serve(port)
+    how, stream = changes()
+    print(f"[watch] serving {SITE_DIR}/ at http://127.0.0.1:{port}/; watching {', '.join(d + '/' for d in WATCH_DIRS)} ({how})")
+    ignore = set()
+    try:
+        for changed in stream:
+            changed = {p for p in changed if not any(fnmatch.fnmatch(p, g) for g in ignore)}
+            if any(p.startswith('scripts/') and p.endswith('.py') for p in changed):
+                _restart(server)
+            steps = affected_steps(changed)
+            if steps:
+                rebuild(steps, ', '.join(sorted(changed)))
+            # Outputs the build just wrote under data/ must not trigger another build.
+            ignore = {g for s in steps for g in s["outputs"] if not g.startswith(SITE_DIR + '/')}
+    except KeyboardInterrupt:
+        print()
+    finally:
+        server.shutdown()